@@ -0,0 +1,107 @@
+"""Run the file I/O and decoding of models in an executor, for use from asyncio."""
+
+import asyncio
+import itertools
+import os
+import weakref
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Optional, Union
+
+from openff.models import _json
+
+if TYPE_CHECKING:
+    from openff.models.models import DefaultModel
+
+    ModelType = type[DefaultModel]
+
+PathLike = Union[str, os.PathLike]
+
+# The default number of loads and saves that can run at once in each event loop
+DEFAULT_LIMIT = 16
+
+_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_limit() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if loop not in _limits:
+        _limits[loop] = asyncio.Semaphore(DEFAULT_LIMIT)
+    return _limits[loop]
+
+
+def _load(cls: "ModelType", path: PathLike) -> "DefaultModel":
+    with open(path, "rb") as fp:
+        return cls.load_json(fp)
+
+
+def _save(model: "DefaultModel", path: PathLike):
+    with open(path, "w") as fp:
+        model.dump_json(fp)
+
+
+def _read_lines(fp, batch_size: int) -> list[bytes]:
+    return list(itertools.islice(fp, batch_size))
+
+
+def _parse_lines(cls: "ModelType", lines: list[bytes]) -> list["DefaultModel"]:
+    return list(_json.iter_jsonl(cls, lines, True))
+
+
+async def load(
+    cls: "ModelType",
+    path: PathLike,
+    executor: Optional[Executor],
+    limit: Optional[asyncio.Semaphore],
+) -> "DefaultModel":
+    async with limit or _default_limit():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _load, cls, path)
+
+
+async def save(
+    model: "DefaultModel",
+    path: PathLike,
+    executor: Optional[Executor],
+    limit: Optional[asyncio.Semaphore],
+):
+    async with limit or _default_limit():
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, _save, model, path)
+
+
+async def iter_jsonl(
+    cls: "ModelType",
+    path: PathLike,
+    executor: Optional[Executor],
+    batch_size: int,
+) -> AsyncIterator["DefaultModel"]:
+    """
+    Yield models from a JSON Lines file, reading and parsing batches of lines in an executor.
+
+    The next batch is read and parsed while the current one is consumed, and no more than that.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def next_batch(fp) -> list["DefaultModel"]:
+        # File objects can't be sent to other processes, so lines are always read in a thread
+        lines = await loop.run_in_executor(None, _read_lines, fp, batch_size)
+        if not lines:
+            return []
+        return await loop.run_in_executor(executor, _parse_lines, cls, lines)
+
+    fp = await loop.run_in_executor(None, open, path, "rb")
+    batch = None
+    try:
+        batch = asyncio.ensure_future(next_batch(fp))
+        while models := await batch:
+            batch = asyncio.ensure_future(next_batch(fp))
+            for model in models:
+                yield model
+    finally:
+        # Let a batch still being read finish before closing the file under it
+        if batch is not None and not batch.done():
+            await asyncio.wait([batch])
+        await loop.run_in_executor(None, fp.close)
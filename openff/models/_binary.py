@@ -0,0 +1,119 @@
+"""A binary file layout for models, with an index of fields so that they can be read alone."""
+
+import functools
+import json
+import os
+import struct
+from collections.abc import Iterable
+from typing import IO, TYPE_CHECKING, Optional, Union
+
+import numpy
+from openff.units import Quantity
+
+from openff.models._json import _quantity_string
+from openff.models.types import (
+    _LazyQuantity,
+    _unit_from_string,
+    _units_of,
+    array_from_bytes,
+    array_to_bytes,
+)
+
+if TYPE_CHECKING:
+    from openff.models.models import DefaultModel
+
+    ModelType = type[DefaultModel]
+
+PathLike = Union[str, os.PathLike]
+
+# Header of a file: magic bytes, format version and the length of the index, a JSON object
+# mapping each field to the offset and length of its payload, relative to the end of the
+# (padded) index, its encoding and its unit, if any. Payloads start at multiples of 8 bytes.
+_MAGIC = b"\x93OFM"
+_HEADER = struct.Struct("<4sB3xI")
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % 8)
+
+
+def _encode(model: "DefaultModel", val) -> tuple[bytes, dict]:
+    """Encode one field value as a payload and the index entry describing it."""
+    if isinstance(val, Quantity):
+        entry = {"unit": str(val.units)}
+        if isinstance(val.m, numpy.ndarray):
+            return array_to_bytes(val.m), {"encoding": "array", **entry}
+        val = val.m
+    else:
+        entry = dict()
+    data = model.__config__.json_dumps(val, default=model.__json_encoder__)
+    return data.encode("utf-8"), {"encoding": "json", **entry}
+
+
+def _decode(data: bytearray, entry: dict, lazy: bool):
+    if entry["encoding"] == "array":
+        if lazy:
+            return _LazyQuantity._from_payload(
+                functools.partial(array_from_bytes, data),
+                _units_of(_unit_from_string(entry["unit"])),
+            )
+        val = array_from_bytes(data)
+    else:
+        val = json.loads(data)
+        if isinstance(val, str):
+            # Strings written by json_encoders, e.g. references to chunked arrays
+            val = _quantity_string(val)
+    if "unit" in entry:
+        return Quantity(val, _unit_from_string(entry["unit"]))
+    return val
+
+
+def save(model: "DefaultModel", path: PathLike):
+    """Write a model to a file with an index of the offsets of its fields."""
+    index, payloads = dict(), list()
+    offset = 0
+    for name, val in model.__dict__.items():
+        data, entry = _encode(model, val)
+        index[name] = {"offset": offset, "length": len(data), **entry}
+        payloads.extend([data, _padding(len(data))])
+        offset += len(data) + len(payloads[-1])
+
+    encoded_index = json.dumps(index).encode("utf-8")
+    with open(path, "wb") as fp:
+        fp.write(_HEADER.pack(_MAGIC, 1, len(encoded_index)))
+        fp.write(encoded_index)
+        fp.write(_padding(_HEADER.size + len(encoded_index)))
+        fp.writelines(payloads)
+
+
+def _read_index(fp: IO) -> tuple[dict, int]:
+    magic, version, index_length = _HEADER.unpack(fp.read(_HEADER.size))
+    if magic != _MAGIC or version != 1:
+        raise ValueError(f"{fp.name} was not written by DefaultModel.save")
+    index = json.loads(fp.read(index_length))
+    start = _HEADER.size + index_length
+    return index, start + len(_padding(start))
+
+
+def load(
+    cls: "ModelType", path: PathLike, fields: Optional[Iterable[str]], lazy: bool
+) -> dict:
+    """Read the values of the named fields, or all fields, of a model written by `save`."""
+    with open(path, "rb") as fp:
+        index, start = _read_index(fp)
+        names = index.keys() if fields is None else fields
+
+        values = dict()
+        for name in names:
+            if name not in cls.__fields__:
+                raise ValueError(f"{cls.__name__} has no field {name}")
+            if name not in index:
+                continue
+            entry = index[name]
+            # Reading into a bytearray leaves arrays decoded from it writeable
+            data = bytearray(entry["length"])
+            fp.seek(start + entry["offset"])
+            fp.readinto(data)
+            values[name] = _decode(data, entry, lazy)
+
+    return values
@@ -0,0 +1,239 @@
+"""Validation of model fields specialized once per model class."""
+
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numpy
+from openff.units import Quantity
+
+from openff.models.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    _converts_to_unit,
+    _new_float_quantity,
+    quantity_pool,
+)
+
+if TYPE_CHECKING:
+    from openff.models.models import DefaultModel
+
+    ModelType = type[DefaultModel]
+
+_missing = object()
+
+
+def _float_quantity(field) -> Callable[[Any], Any]:
+    """
+    Tag plain floats and ints with the declared unit of a FloatQuantity field.
+
+    Float quantities already in that unit are accepted as they are.
+    """
+    units = field.type_._unit._units
+
+    def validate(val):
+        t = type(val)
+        if t is float:
+            return _new_float_quantity(val, units)
+        if t is int:
+            return _new_float_quantity(float(val), units)
+        if t is Quantity and type(val._magnitude) is float and val._units == units:
+            return val
+        return _missing
+
+    return validate
+
+
+def _array_quantity(field) -> Callable[[Any], Any]:
+    """
+    Tag plain NumPy arrays with the declared unit of an ArrayQuantity field.
+
+    Array quantities already in that unit are accepted as they are.
+    """
+    unit_ = field.type_._unit
+    units = unit_._units
+
+    def validate(val):
+        t = type(val)
+        if t is numpy.ndarray:
+            return val * unit_
+        if t is Quantity and type(val._magnitude) is numpy.ndarray:
+            if val._units == units:
+                return val
+        return _missing
+
+    return validate
+
+
+def _exact(type_: type) -> Callable[[Any], Any]:
+    """Pass through values of exactly the annotated type, which pydantic would return as-is."""
+
+    def validate(val):
+        return val if type(val) is type_ else _missing
+
+    return validate
+
+
+def _plain_types(config) -> set:
+    """The builtin types whose pydantic validators do nothing to values of that type."""
+    types = {int, bool}
+    if config.allow_inf_nan:
+        types.add(float)
+    if not any(
+        [
+            config.anystr_strip_whitespace,
+            config.anystr_upper,
+            config.anystr_lower,
+            config.min_anystr_length,
+            config.max_anystr_length,
+        ]
+    ):
+        types.add(str)
+    return types
+
+
+def _fast_validator(field, plain_types: set) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a validator for the common inputs of a field, which returns `_missing` for others.
+
+    Returns None if the field has no such fast path.
+    """
+    if field.shape != 1 or field.sub_fields or field.class_validators:
+        return None
+    if field.field_info.const or field.pre_validators or field.post_validators:
+        # e.g. the check of `Field(const=True)`, which the fast path would skip
+        return None
+
+    type_ = field.type_
+    if not isinstance(type_, type):
+        return None
+    if issubclass(type_, FloatQuantity) and _converts_to_unit(type_):
+        validate = _float_quantity(field)
+    elif issubclass(type_, ArrayQuantity) and _converts_to_unit(type_):
+        validate = _array_quantity(field)
+    elif type_ in plain_types and field.outer_type_ is type_:
+        validate = _exact(type_)
+    else:
+        return None
+
+    if not field.allow_none:
+        return validate
+
+    def validate_optional(val):
+        return None if val is None else validate(val)
+
+    return validate_optional
+
+
+_interned: "weakref.WeakKeyDictionary[type, frozenset[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def interned(cls: "ModelType") -> frozenset[str]:
+    """Return the FloatQuantity fields of a model class with `Config.intern_quantities`."""
+    try:
+        return _interned[cls]
+    except KeyError:
+        pass
+
+    names = set()
+    if getattr(cls.__config__, "intern_quantities", False):
+        for name, field in cls.__fields__.items():
+            if isinstance(field.type_, type):
+                if issubclass(field.type_, FloatQuantity):
+                    names.add(name)
+    _interned[cls] = frozenset(names)
+    return _interned[cls]
+
+
+class _Validators:
+    """
+    Validate the arguments of a model class, and assignments to it, as pydantic would.
+
+    Values of the common types of each field (e.g. floats and ndarrays for quantities with
+    declared units) are validated by functions built once for the class, and others by
+    their field's validators. Anything unusual, such as missing, extra or invalid values,
+    is left to pydantic, so that errors are raised exactly as before.
+    """
+
+    def __init__(self, cls: "ModelType"):
+        self.cls = cls
+        config = cls.__config__
+        self.validate_all = config.validate_all
+        plain_types = _plain_types(config)
+        self.fields = [
+            (name, field.alias, field, _fast_validator(field, plain_types))
+            for name, field in cls.__fields__.items()
+        ]
+
+        # The fields whose values are shared through `quantity_pool`
+        self.interned = interned(cls)
+
+        # The fast validators of fields which can be assigned to
+        self.assign = dict()
+        if config.validate_assignment and config.allow_mutation and not config.frozen:
+            for name, _, field, fast in self.fields:
+                if fast is not None and field.field_info.allow_mutation:
+                    if not field.final:
+                        self.assign[name] = fast
+
+    def validate_init(self, data: dict) -> Optional[tuple[dict, set]]:
+        """Validate keyword arguments, or return None if pydantic needs to."""
+        values: dict = dict()
+        fields_set = set()
+        for name, alias, field, fast in self.fields:
+            value = data.get(alias, _missing)
+            if value is _missing:
+                if field.required:
+                    return None
+                value = field.get_default()
+                if not self.validate_all and not field.validate_always:
+                    values[name] = value
+                    continue
+            else:
+                fields_set.add(name)
+
+            validated = fast(value) if fast is not None else _missing
+            if validated is _missing:
+                validated, errors = field.validate(
+                    value, values, loc=alias, cls=self.cls
+                )
+                if errors:
+                    return None
+            if name in self.interned:
+                validated = quantity_pool.intern(validated)
+            values[name] = validated
+
+        if len(fields_set) != len(data):
+            # Extra or aliased arguments
+            return None
+        return values, fields_set
+
+
+_validators: "weakref.WeakKeyDictionary[type, Optional[_Validators]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def validators(cls: "ModelType") -> Optional[_Validators]:
+    """
+    Return the validators of a model class, built on first use.
+
+    Returns None for classes with root validators, a custom root type or fields that can be
+    populated by either their name or alias, which are left to pydantic.
+    """
+    try:
+        return _validators[cls]
+    except KeyError:
+        pass
+
+    compatible = all(
+        [
+            not cls.__pre_root_validators__,
+            not cls.__post_root_validators__,
+            not cls.__custom_root_type__,
+            not any(field.alt_alias for field in cls.__fields__.values()),
+        ]
+    )
+    _validators[cls] = _Validators(cls) if compatible else None
+    return _validators[cls]
@@ -0,0 +1,520 @@
+"""Incremental reading and writing of the JSON produced by `DefaultModel.json`."""
+
+import codecs
+import json
+import re
+import weakref
+from collections.abc import Iterable, Iterator
+from typing import IO, TYPE_CHECKING, Any, Optional, TextIO
+
+import numpy
+from openff.units import Quantity, Unit
+
+from openff.models.types import (
+    _magnitude_of,
+    _magnitude_to_json,
+    _open_chunked_array,
+    _unit_from_string,
+    _units_of,
+    custom_quantity_encoder,
+)
+
+if TYPE_CHECKING:
+    from openff.models.models import DefaultModel
+
+    ModelType = type[DefaultModel]
+
+
+def _is_array_quantity(val) -> bool:
+    return isinstance(val, Quantity) and isinstance(val.m, numpy.ndarray)
+
+
+def _write_nested(fp: TextIO, array: numpy.ndarray, chunk_size: int):
+    """
+    Write an array as nested JSON lists, formatted exactly as `json.dumps(array.tolist())`.
+
+    At most about `chunk_size` elements are converted to Python objects at a time.
+    """
+    if array.ndim == 0 or array.size <= chunk_size:
+        fp.write(json.dumps(array.tolist()))
+        return
+
+    fp.write("[")
+    if array.ndim == 1:
+        for start in range(0, len(array), chunk_size):
+            if start:
+                fp.write(", ")
+            fp.write(json.dumps(array[start : start + chunk_size].tolist())[1:-1])
+    else:
+        row_size = array[0].size
+        if row_size > chunk_size:
+            for index, row in enumerate(array):
+                if index:
+                    fp.write(", ")
+                _write_nested(fp, row, chunk_size)
+        else:
+            rows_per_chunk = chunk_size // max(row_size, 1)
+            for start in range(0, len(array), rows_per_chunk):
+                if start:
+                    fp.write(", ")
+                block = array[start : start + rows_per_chunk]
+                fp.write(json.dumps(block.tolist())[1:-1])
+    fp.write("]")
+
+
+def _write_array_quantity(fp: TextIO, val: Quantity, chunk_size: int):
+    """
+    Write an array quantity as `custom_quantity_encoder` would, itself encoded as a JSON string.
+
+    The inner document only needs its quotes escaped, so the numbers of the array are written
+    directly into the outer string.
+    """
+    fp.write(json.dumps('{"val": ')[:-1])
+    _write_nested(fp, numpy.asarray(val.m), chunk_size)
+    fp.write(json.dumps(', "unit": ' + json.dumps(str(val.units)) + "}")[1:])
+
+
+def dump_json(model: "DefaultModel", fp: TextIO, chunk_size: int):
+    """Write the same document as `model.json()` to a text file, one field at a time."""
+    config = model.__config__
+    stream_arrays = config.json_encoders.get(Quantity) is custom_quantity_encoder
+
+    fp.write("{")
+    for index, (key, val) in enumerate(model._iter(to_dict=True)):
+        if index:
+            fp.write(", ")
+        fp.write(json.dumps(key))
+        fp.write(": ")
+        if stream_arrays and _is_array_quantity(val):
+            _write_array_quantity(fp, val, chunk_size)
+        else:
+            fp.write(config.json_dumps(val, default=model.__json_encoder__))
+    fp.write("}")
+
+
+_QUANTITY_PREFIX = json.dumps('{"val": ')[:-1]
+
+# Types which `json.dumps` encodes without a `default` function
+_PLAIN_TYPES = {str, int, float, bool, type(None)}
+
+
+class _Serializer:
+    """
+    Write the same document as `DefaultModel.json()` for models of one class.
+
+    Built once per class, see `serializer`, so that the key of each field is encoded once,
+    quantities are written directly rather than through `custom_quantity_encoder` and a JSON
+    encoder with the model's `default` function is only created once.
+    """
+
+    def __init__(self, cls: "ModelType"):
+        self.keys = {name: json.dumps(name) + ": " for name in cls.__fields__}
+        self.encoder = json.JSONEncoder(default=cls.__json_encoder__)
+        self.cls = cls
+        # The end of the string-encoded data of a quantity, by the units of the quantity
+        self.suffixes: dict = dict()
+
+    def quantity(self, val: Quantity) -> Optional[str]:
+        """Encode a quantity as `custom_quantity_encoder` would, or return None to fall back."""
+        magnitude = _magnitude_of(val)
+        if type(magnitude) is float:
+            encoded = json.dumps(magnitude)
+        elif type(magnitude) is numpy.ndarray and magnitude.dtype.kind in "biuf":
+            encoded = json.dumps(magnitude.tolist())
+        else:
+            return None
+
+        units = _units_of(val)
+        suffix = self.suffixes.get(units)
+        if suffix is None:
+            suffix = self.suffixes[units] = json.dumps(
+                ', "unit": ' + json.dumps(str(val.units)) + "}"
+            )[1:]
+        return _QUANTITY_PREFIX + encoded + suffix
+
+    def __call__(self, model: "DefaultModel") -> str:
+        parts = list()
+        for name, val in model.__dict__.items():
+            key = self.keys.get(name) or json.dumps(name) + ": "
+            if type(val) in _PLAIN_TYPES:
+                parts.append(key + json.dumps(val))
+                continue
+            if isinstance(val, Quantity):
+                encoded = self.quantity(val)
+                if encoded is not None:
+                    parts.append(key + encoded)
+                    continue
+            val = model._get_value(
+                val,
+                to_dict=True,
+                by_alias=False,
+                include=None,
+                exclude=None,
+                exclude_unset=False,
+                exclude_defaults=False,
+                exclude_none=False,
+            )
+            parts.append(key + self.encoder.encode(val))
+        return "{" + ", ".join(parts) + "}"
+
+
+_serializers: "weakref.WeakKeyDictionary[type, Optional[_Serializer]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def serializer(cls: "ModelType") -> Optional[_Serializer]:
+    """
+    Return the serializer of a model class, or None if its configuration needs the generic path.
+
+    Classes with their own encoder for quantities or `json_dumps`, a custom root type or
+    fields excluded from serialization are left to pydantic.
+    """
+    try:
+        return _serializers[cls]
+    except KeyError:
+        pass
+
+    config = cls.__config__
+    compatible = all(
+        [
+            config.json_encoders.get(Quantity) is custom_quantity_encoder,
+            config.json_dumps is json.dumps,
+            not cls.__custom_root_type__,
+            not cls.__exclude_fields__,
+            not cls.__include_fields__,
+        ]
+    )
+    _serializers[cls] = _Serializer(cls) if compatible else None
+    return _serializers[cls]
+
+
+# How `_write_array_quantity` (and `custom_quantity_encoder`, for arrays) starts and ends the
+# string-encoded data of an array quantity
+_ARRAY_PREFIX = json.dumps('{"val": [')[:-1]
+_ARRAY_SUFFIX = json.dumps(', "unit": ')[1:-1]
+
+_CLOSING_BRACKETS = re.compile(r"\]+")
+_FLOAT_MARKERS = re.compile(r"[.eEIN]")
+# Integers which may not fit in an int64, which has at most 19 digits
+_LONG_INTEGERS = re.compile(r"\d{19}")
+_STRIP_BRACKETS = str.maketrans("", "", "[]")
+
+_DECODER = json.JSONDecoder()
+
+
+class _Scanner:
+    """Buffered, forward-only access to the text of a file object."""
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """Read at least one more chunk, dropping consumed text. Returns False at the end."""
+        if self.eof:
+            return False
+        data = self._fp.read(max(size, self._chunk_size))
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data, final=not data)
+        self.eof = not data
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+        return not self.eof
+
+    def ensure(self, size: int) -> bool:
+        """Make sure that `size` characters after the current position are buffered."""
+        while len(self.buf) - self.pos < size:
+            if not self.fill():
+                return False
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\n\r":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON data")
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(
+                f"Expected {char!r} in JSON data, found {self.buf[self.pos]!r}"
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more data as needed."""
+        self.peek()
+        size = self._chunk_size
+        while True:
+            try:
+                val, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill(size):
+                    raise
+            else:
+                # A number at the end of the buffer might continue in the next chunk
+                if end < len(self.buf) or not self.fill(size):
+                    self.pos = end
+                    return val
+            size *= 2
+
+    def array(self) -> numpy.ndarray:
+        """
+        Decode nested lists of numbers, ending before `_ARRAY_SUFFIX`, into a NumPy array.
+
+        Numbers are parsed with `numpy.fromstring` into a growing buffer, a chunk of text at
+        a time, and the shape is worked out from the runs of closing brackets.
+        """
+        parser = _ArrayParser(self)
+        while True:
+            end = self.buf.find(_ARRAY_SUFFIX, self.pos)
+            if end != -1:
+                parser.parse(self.buf[self.pos : end])
+                self.pos = end + len(_ARRAY_SUFFIX)
+                return parser.result()
+
+            # Cut after the last complete number, so that no run of brackets is split,
+            # skipping commas which could be the start of `_ARRAY_SUFFIX`
+            cut = len(self.buf)
+            while (cut := self.buf.rfind(",", self.pos, cut)) != -1:
+                following = self.buf[cut + 1 : cut + 3]
+                if len(following) == 2 and following != " \\":
+                    break
+            if cut != -1:
+                parser.parse(self.buf[self.pos : cut])
+                self.pos = cut + 1
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON data in array")
+
+    def encoded_string_tail(self) -> str:
+        """Decode the rest of a JSON-encoded object, itself in a JSON string, up to `}"`."""
+        while (end := self.buf.find('}"', self.pos)) == -1:
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON data in string")
+        tail = json.loads('"' + self.buf[self.pos : end] + '"')
+        self.pos = end + 2
+        return json.loads(tail)
+
+
+class _ArrayParser:
+    """Accumulate the numbers and shape of a nested JSON list, one segment at a time."""
+
+    def __init__(self, scanner: _Scanner):
+        scanner.ensure(1)
+        self.ndim = 0
+        while True:
+            while scanner.pos < len(scanner.buf) and scanner.buf[scanner.pos] == "[":
+                scanner.pos += 1
+                self.ndim += 1
+            if scanner.pos < len(scanner.buf) or not scanner.fill():
+                break
+
+        # shape[1:], worked out from the brackets closing the first row
+        self.inner: list = [None] * (self.ndim - 1)
+        self.runs = [0] * self.ndim
+        self.commas = 0
+        self.done = self.ndim <= 1
+
+        self.buffer = numpy.empty(1024, dtype=numpy.int64)
+        self.size = 0
+        # The number of empty innermost lists, e.g. in an array of shape (2, 0), the first of
+        # which had its opening bracket read above
+        self.empty = 1
+
+    def parse(self, segment: str):
+        if not self.done:
+            self._parse_brackets(segment)
+
+        self.empty += segment.count("[]")
+        numbers = segment.translate(_STRIP_BRACKETS)
+        if not numbers.strip(", \t\r\n"):
+            # Only brackets and commas, e.g. between empty lists
+            return
+        if self.buffer.dtype != numpy.float64:
+            if _FLOAT_MARKERS.search(numbers):
+                self.buffer = self.buffer.astype(numpy.float64)
+            elif self.buffer.dtype == numpy.uint64 or _LONG_INTEGERS.search(numbers):
+                self._widen(numbers)
+
+        values = numpy.fromstring(numbers, dtype=self.buffer.dtype, sep=",")
+        if len(values) != numbers.count(",") + 1:
+            raise ValueError("Could not parse array of numbers in JSON data")
+
+        if self.size + len(values) > len(self.buffer):
+            self.buffer.resize(
+                max(2 * len(self.buffer), self.size + len(values)), refcheck=False
+            )
+        self.buffer[self.size : self.size + len(values)] = values
+        self.size += len(values)
+
+    def _widen(self, numbers: str):
+        """
+        Change the dtype of the buffer for integers out of the range of int64, which
+        `numpy.fromstring` would clamp, as `numpy.asarray` would: to uint64 if none of the
+        integers fit in an int64, or else to float64.
+        """
+        values = numpy.asarray(json.loads("[" + numbers + "]"))
+        if values.dtype == object:
+            raise ValueError("Found integers out of the range of uint64 in JSON data")
+        if values.dtype == numpy.uint64 and self.size == 0:
+            self.buffer = self.buffer.astype(numpy.uint64)
+        elif values.dtype != self.buffer.dtype:
+            self.buffer = self.buffer.astype(numpy.float64)
+
+    def _parse_brackets(self, segment: str):
+        """Count the runs of closing brackets in a segment, until those of the first row."""
+        for match in _CLOSING_BRACKETS.finditer(segment):
+            length = len(match.group())
+            if self.inner[-1] is None:
+                before = segment[: match.start()]
+                self.commas += before.count(",")
+                has_numbers = self.commas or before.strip(" [")
+                self.inner[-1] = self.commas + 1 if has_numbers else 0
+            # Before the first run of at least `level + 1` brackets, the runs of at least
+            # `level` brackets each close one of the rows along that axis
+            for level in range(1, min(length, self.ndim - 2) + 1):
+                self.runs[level] += 1
+            for level in range(1, self.ndim - 1):
+                if self.inner[-1 - level] is None and length > level:
+                    self.inner[-1 - level] = self.runs[level]
+            if length >= self.ndim - 1:
+                self.done = True
+                return
+        # Segments are split at commas, which are not included in either segment
+        self.commas += segment.count(",") + 1
+
+    def result(self) -> numpy.ndarray:
+        if not self.done:
+            raise ValueError("Could not determine the shape of array in JSON data")
+        self.buffer.resize(self.size, refcheck=False)
+        if self.size == 0:
+            # As `numpy.asarray([])`
+            self.buffer = self.buffer.astype(numpy.float64)
+
+        inner_size = int(numpy.prod(self.inner))
+        if inner_size == 0:
+            # Only the innermost lists can be empty, so the rows are counted from them
+            rows = int(numpy.prod(self.inner[:-1]))
+            return self.buffer.reshape(self.empty // rows, *self.inner)
+        if self.size % inner_size:
+            raise ValueError("Found a ragged array in JSON data")
+        return self.buffer.reshape(self.size // inner_size, *self.inner)
+
+
+def _quantity_string(val: str) -> Any:
+    """Decode a string-encoded quantity as `json_loader` does, passing other strings through."""
+    try:
+        data = json.loads(val)
+    except json.JSONDecodeError:
+        return val
+    if isinstance(data, dict) and data.keys() == {"val", "unit"}:
+        return _unit_from_string(data["unit"]) * data["val"]
+    if isinstance(data, dict) and data.keys() == {"path", "unit"}:
+        return _open_chunked_array(data["path"])
+    return val
+
+
+def load_json(fp: IO, chunk_size: int) -> dict:
+    """
+    Load the output of `DefaultModel.json` from a text or binary file object, as `json_loader`.
+
+    Array quantities are decoded directly into NumPy buffers as the file is read.
+    """
+    scanner = _Scanner(fp, chunk_size)
+    out: dict = dict()
+
+    scanner.expect("{")
+    if scanner.peek() == "}":
+        return out
+
+    while True:
+        key = scanner.value()
+        scanner.expect(":")
+        scanner.peek()
+        scanner.ensure(len(_ARRAY_PREFIX))
+        if scanner.buf.startswith(_ARRAY_PREFIX, scanner.pos):
+            scanner.pos += len(_ARRAY_PREFIX) - 1
+            array = scanner.array()
+            unit_ = scanner.encoded_string_tail()
+            out[key] = Quantity(array, _unit_from_string(unit_))
+        else:
+            val = scanner.value()
+            out[key] = _quantity_string(val) if isinstance(val, str) else val
+
+        if scanner.peek() == "}":
+            return out
+        scanner.expect(",")
+
+
+def write_jsonl(models: Iterable["DefaultModel"], fp: TextIO):
+    """Write models to a text file, one JSON document per line."""
+    for model in models:
+        fp.write(model.json())
+        fp.write("\n")
+
+
+def iter_jsonl(
+    cls: "ModelType", fp: Iterable, validate: bool
+) -> Iterator["DefaultModel"]:
+    """Lazily load models of one class from a JSON Lines file or lines, skipping blank lines."""
+    json_loads = cls.__config__.json_loads
+    for line in fp:
+        if line.strip():
+            if validate:
+                yield cls.parse_raw(line)
+            else:
+                yield cls.construct(**json_loads(line))
+
+
+def dump_collection(models: Iterable["DefaultModel"], fp: TextIO):
+    """
+    Write models to a text file as one JSON document with a shared table of units.
+
+    Each quantity is written as `{"val": ..., "unit": index}`, where `index` points into the
+    `"units"` list at the top of the document.
+    """
+    unit_indices: dict = dict()
+    records = list()
+    for model in models:
+        record = dict()
+        for key, val in model._iter(to_dict=True):
+            if isinstance(val, Quantity):
+                index = unit_indices.setdefault(_units_of(val), len(unit_indices))
+                val = {"val": _magnitude_to_json(val), "unit": index}
+            record[key] = val
+        records.append((model, record))
+
+    fp.write('{"units": ')
+    fp.write(json.dumps([str(Unit(units)) for units in unit_indices]))
+    fp.write(', "models": [')
+    for index, (model, record) in enumerate(records):
+        if index:
+            fp.write(", ")
+        fp.write(model.__config__.json_dumps(record, default=model.__json_encoder__))
+    fp.write("]}")
+
+
+def load_collection(cls: "ModelType", fp: IO) -> list["DefaultModel"]:
+    """Load models written by `dump_collection`, parsing each unit only once."""
+    data = json.load(fp)
+    units = [_unit_from_string(unit_) for unit_ in data["units"]]
+
+    models = list()
+    for record in data["models"]:
+        for key, val in record.items():
+            if isinstance(val, dict) and val.keys() == {"val", "unit"}:
+                record[key] = units[val["unit"]] * val["val"]
+            elif isinstance(val, str):
+                # e.g. a reference to a chunked array
+                record[key] = _quantity_string(val)
+        models.append(cls.parse_obj(record))
+    return models
@@ -1,4 +1,16 @@
 try:
-    from pydantic.v1 import BaseModel
+    from pydantic.v1 import (
+        BaseModel,
+        Field,
+        PrivateAttr,
+        ValidationError,
+        root_validator,
+    )
 except ImportError:
-    from pydantic import BaseModel  # type: ignore[assignment]
+    from pydantic import (  # type: ignore[assignment, no-redef]
+        BaseModel,
+        Field,
+        PrivateAttr,
+        ValidationError,
+        root_validator,
+    )
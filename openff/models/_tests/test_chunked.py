@@ -0,0 +1,170 @@
+import io
+
+import numpy as np
+import pytest
+from openff.units import unit
+
+from openff.models.chunked import ChunkedArray
+from openff.models.models import DefaultModel
+from openff.models.store import ModelStore
+from openff.models.types import ArrayQuantity
+
+try:
+    from pydantic.v1 import ValidationError
+except ImportError:
+    from pydantic import ValidationError
+
+
+@pytest.fixture
+def array():
+    return np.arange(7 * 5 * 3, dtype=np.float32).reshape(7, 5, 3) * unit.nanometer
+
+
+class TestChunkedArray:
+    @pytest.mark.parametrize("compression", [None, "zlib", "lzma"])
+    def test_roundtrip(self, tmp_path, array, compression):
+        chunked = ChunkedArray.from_array(
+            tmp_path / "array", array, (3, 2, 3), compression=compression
+        )
+        reopened = ChunkedArray(tmp_path / "array")
+
+        assert reopened.shape == (7, 5, 3)
+        assert reopened.dtype == np.float32
+        assert reopened.compression == compression
+        assert reopened == chunked
+        assert np.array_equal(reopened[...].m, array.m)
+        assert reopened[...].units == unit.nanometer
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            0,
+            -1,
+            slice(2, 6),
+            (slice(None), 3),
+            (slice(1, None, 2), slice(None, None, -2), 1),
+            (Ellipsis, 2),
+            (4, Ellipsis, slice(0, 0)),
+        ],
+    )
+    def test_slicing(self, tmp_path, array, key):
+        chunked = ChunkedArray.from_array(tmp_path / "array", array, (3, 2, 2))
+        assert np.array_equal(chunked[key].m, array.m[key])
+
+    def test_reads_only_needed_chunks(self, tmp_path, array):
+        chunked = ChunkedArray.from_array(tmp_path / "array", array, (3, 5, 3))
+        (tmp_path / "array" / "0.0.0").unlink()
+
+        # The missing chunk reads as zeros, but rows outside of it are unaffected
+        assert np.array_equal(chunked[3:].m, array.m[3:])
+        assert not chunked[:3].m.any()
+
+    def test_write_converts_units(self, tmp_path, array):
+        chunked = ChunkedArray.from_array(tmp_path / "array", array, (2, 2, 2))
+        chunked[1:3, 0] = 1.0 * unit.angstrom
+        assert np.allclose(chunked[1:3, 0].m, 0.1)
+        assert np.array_equal(chunked[3:].m, array.m[3:])
+
+    def test_append(self, tmp_path, array):
+        chunked = ChunkedArray.create(
+            tmp_path / "traj", (0, 5, 3), "float32", "nanometer", (4, 5, 3)
+        )
+        for frames in (array[:3], array[3:5], array[5:]):
+            chunked.append(frames)
+
+        assert len(ChunkedArray(tmp_path / "traj")) == 7
+        assert np.array_equal(chunked[...].m, array.m)
+
+        with pytest.raises(ValueError, match="shape"):
+            chunked.append(np.zeros((1, 4, 3)) * unit.nanometer)
+
+    def test_invalid(self, tmp_path):
+        with pytest.raises(ValueError, match="compression"):
+            ChunkedArray.create(
+                tmp_path / "a", (3,), float, "nm", (1,), compression="x"
+            )
+        with pytest.raises(ValueError, match="Chunks"):
+            ChunkedArray.create(tmp_path / "a", (3, 3), float, "nm", (1,))
+
+        chunked = ChunkedArray.create(tmp_path / "a", (3, 3), float, "nm", (2, 2))
+        with pytest.raises(IndexError):
+            chunked[3]
+        with pytest.raises(IndexError):
+            chunked[[0, 1]]
+
+
+class TestChunkedArrayField:
+    class Trajectory(DefaultModel):
+        positions: ArrayQuantity["nanometer"]
+        velocities: ArrayQuantity["[length] / [time]"]
+
+    def test_model_refers_to_chunked_array(self, tmp_path, array):
+        positions = ChunkedArray.from_array(tmp_path / "positions", array, (2, 5, 3))
+        velocities = ChunkedArray.from_array(
+            tmp_path / "velocities",
+            array.m * unit.angstrom / unit.picosecond,
+            (7, 5, 3),
+        )
+
+        trajectory = self.Trajectory(positions=positions, velocities=velocities)
+        assert trajectory.positions is positions
+
+        loaded = self.Trajectory.parse_raw(trajectory.json())
+        assert loaded.positions == positions
+        assert np.array_equal(loaded.velocities[2].m, array.m[2])
+
+    def test_collection(self, tmp_path, array):
+        positions = ChunkedArray.from_array(tmp_path / "positions", array, (2, 5, 3))
+
+        class Frames(DefaultModel):
+            name: str
+            positions: ArrayQuantity["nanometer"]
+
+        fp = io.StringIO()
+        Frames.dump_collection([Frames(name="a", positions=positions)], fp)
+        fp.seek(0)
+        (loaded,) = Frames.load_collection(fp)
+
+        assert loaded.name == "a"
+        assert loaded.positions == positions
+
+    def test_store(self, tmp_path, array):
+        positions = ChunkedArray.from_array(tmp_path / "positions", array, (2, 5, 3))
+
+        class Frames(DefaultModel):
+            declared: ArrayQuantity["nanometer"]
+            undeclared: ArrayQuantity
+
+        store = ModelStore(Frames, ":memory:")
+        store.insert([Frames(declared=positions, undeclared=positions)])
+        (loaded,) = store.select()
+
+        assert loaded.declared == positions
+        assert loaded.undeclared == positions
+
+    def test_relative_path(self, tmp_path, array, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        positions = ChunkedArray.from_array("positions", array, (2, 5, 3))
+
+        class Frames(DefaultModel):
+            positions: ArrayQuantity["nanometer"]
+
+        data = Frames(positions=positions).json()
+
+        # The reference does not depend on the working directory
+        monkeypatch.chdir(tmp_path.parent)
+        loaded = Frames.parse_raw(data)
+        assert loaded.positions.path == tmp_path.resolve() / "positions"
+        assert np.array_equal(loaded.positions[0].m, array.m[0])
+
+    def test_units_checked_without_reading(self, tmp_path, array):
+        chunked = ChunkedArray.from_array(tmp_path / "array", array, (7, 5, 3))
+        angstrom = ChunkedArray.from_array(
+            tmp_path / "other", array.to(unit.angstrom), (7, 5, 3)
+        )
+        with pytest.raises(ValidationError, match="stored in units of nanometer"):
+            self.Trajectory(positions=angstrom, velocities=chunked)
+        with pytest.raises(
+            ValidationError, match=r"dimensionality \[length\] / \[time\]"
+        ):
+            self.Trajectory(positions=chunked, velocities=chunked)
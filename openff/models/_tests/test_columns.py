@@ -0,0 +1,217 @@
+import numpy as np
+import pytest
+from openff.units import unit
+
+from openff.models._pydantic import Field, ValidationError, root_validator
+from openff.models.columns import assign_column, column, from_records, to_records
+from openff.models.exceptions import UnitValidationError
+from openff.models.models import DefaultModel, FrozenDefaultModel
+from openff.models.types import ArrayQuantity, FloatQuantity
+
+
+class Atom(DefaultModel):
+    name: str
+    charge: FloatQuantity["elementary_charge"]
+    mass: FloatQuantity["[mass]"]
+    position: ArrayQuantity["nanometer"]
+
+
+@pytest.fixture
+def atoms():
+    return [
+        Atom(
+            name=f"A{i}",
+            charge=0.1 * i,
+            mass=(i + 1) * (unit.kilogram if i % 2 else unit.gram),
+            position=np.full(3, float(i)),
+        )
+        for i in range(5)
+    ]
+
+
+class TestColumn:
+    def test_float_column(self, atoms):
+        charges = column(atoms, "charge")
+        assert charges.units == unit.elementary_charge
+        assert np.allclose(charges.m, [0.0, 0.1, 0.2, 0.3, 0.4])
+
+        coulombs = column(atoms, "charge", "coulomb")
+        assert np.allclose(coulombs.m, charges.m_as(unit.coulomb))
+
+    def test_mixed_units(self, atoms):
+        masses = column(atoms, "mass", unit.kilogram)
+        assert np.allclose(masses.m, [0.001, 2.0, 0.003, 4.0, 0.005])
+
+        masses = column(atoms, "mass")
+        assert masses.units == unit.gram
+        assert np.allclose(masses.m, [1.0, 2000.0, 3.0, 4000.0, 5.0])
+
+    def test_array_column(self, atoms):
+        positions = column(atoms, "position", "angstrom")
+        assert positions.shape == (5, 3)
+        assert np.allclose(positions.m[:, 0], np.arange(5) * 10.0)
+
+    def test_plain_column(self, atoms):
+        assert column(atoms, "name").tolist() == ["A0", "A1", "A2", "A3", "A4"]
+
+    def test_empty(self):
+        assert column([], "charge", "elementary_charge").shape == (0,)
+        with pytest.raises(ValueError, match="unit"):
+            column([], "charge")
+
+    def test_invalid(self, atoms):
+        with pytest.raises(ValueError, match="no field"):
+            column(atoms, "velocity")
+        with pytest.raises(ValueError, match="have a value"):
+            column([*atoms, Atom.construct()], "charge")
+
+        class Ion(Atom):
+            pass
+
+        with pytest.raises(ValueError, match="same class"):
+            column([*atoms, Ion(**atoms[0].__dict__)], "charge")
+
+
+class TestAssignColumn:
+    def test_float_column(self, atoms):
+        charges = column(atoms, "charge")
+        assign_column(atoms, "charge", (charges * 2).to(unit.coulomb))
+
+        for i, atom in enumerate(atoms):
+            assert atom.charge.units == unit.elementary_charge
+            assert type(atom.charge.m) is float
+            assert atom.charge.m == pytest.approx(0.2 * i)
+
+    def test_dimension_only(self, atoms):
+        assign_column(atoms, "mass", np.ones(5) * unit.kilogram)
+        assert atoms[3].mass.units == unit.kilogram
+
+        with pytest.raises(UnitValidationError):
+            assign_column(atoms, "mass", np.ones(5) * unit.meter)
+
+    def test_array_column(self, atoms):
+        positions = np.arange(15, dtype=float).reshape(5, 3) * unit.angstrom
+        assign_column(atoms, "position", positions)
+
+        assert atoms[1].position.units == unit.nanometer
+        assert np.allclose(atoms[1].position.m, [0.3, 0.4, 0.5])
+
+        positions.m[1] = 0.0
+        assert atoms[1].position.m[0] == pytest.approx(0.3)
+
+    def test_invalid(self, atoms):
+        with pytest.raises(UnitValidationError, match="units of nanometer"):
+            assign_column(atoms, "charge", np.ones(5) * unit.nanometer)
+        with pytest.raises(ValueError, match="5 models"):
+            assign_column(atoms, "charge", np.ones(4) * unit.elementary_charge)
+        with pytest.raises(ValueError, match="not a quantity"):
+            assign_column(atoms, "name", np.ones(5) * unit.elementary_charge)
+
+    def test_frozen(self):
+        class Parameter(FrozenDefaultModel):
+            sigma: FloatQuantity["nanometer"]
+
+        with pytest.raises(TypeError, match="immutable"):
+            assign_column([Parameter(sigma=1.0)], "sigma", [1.0] * unit.nanometer)
+
+    def test_checked_fields(self):
+        class Parameter(DefaultModel):
+            sigma: FloatQuantity["nanometer"] = Field(allow_mutation=False)
+            epsilon: FloatQuantity["kilojoule / mole"] = Field(
+                1.0 * unit.kilojoule_per_mole, const=True
+            )
+
+        parameters = [Parameter(sigma=1.0), Parameter(sigma=2.0)]
+
+        with pytest.raises(TypeError, match="allow_mutation"):
+            assign_column(parameters, "sigma", [1.0, 2.0] * unit.nanometer)
+        with pytest.raises(ValidationError, match="const"):
+            assign_column(parameters, "epsilon", [1.0, 2.0] * unit.kilojoule_per_mole)
+
+        assert parameters[1].sigma == 2.0 * unit.nanometer
+        assert parameters[1].epsilon == 1.0 * unit.kilojoule_per_mole
+
+
+class TestRecords:
+    def test_to_records(self, atoms):
+        records, units = to_records(atoms)
+
+        assert records.dtype.names == ("name", "charge", "mass", "position")
+        assert records.dtype["position"].shape == (3,)
+        assert units == {
+            "charge": "elementary_charge",
+            "mass": "gram",
+            "position": "nanometer",
+        }
+        assert records["name"].tolist() == ["A0", "A1", "A2", "A3", "A4"]
+        assert np.allclose(records["mass"], [1.0, 2000.0, 3.0, 4000.0, 5.0])
+        assert np.allclose(records["position"][:, 1], np.arange(5))
+
+    def test_round_trip(self, atoms, tmp_path):
+        records, units = to_records(atoms)
+        np.save(tmp_path / "atoms.npy", records)
+
+        loaded = from_records(Atom, np.load(tmp_path / "atoms.npy"), units)
+        for atom, loaded_atom in zip(atoms, loaded):
+            assert loaded_atom.name == atom.name
+            assert loaded_atom.charge == atom.charge
+            assert loaded_atom.mass == atom.mass.to(unit.gram)
+            assert np.array_equal(loaded_atom.position.m, atom.position.m)
+        assert type(loaded[0].charge.m) is float
+        assert type(loaded[0].name) is str
+
+    def test_units(self, atoms):
+        records, _ = to_records(atoms, fields=["name", "charge", "mass", "position"])
+        loaded = from_records(
+            Atom, records, {"mass": "kilogram", "position": "angstrom"}
+        )
+
+        assert loaded[1].mass == 2000.0 * unit.kilogram
+        assert loaded[1].position.units == unit.nanometer
+        assert np.allclose(loaded[1].position.m, [0.1, 0.1, 0.1])
+
+        with pytest.raises(ValueError, match="unit of field mass"):
+            from_records(Atom, records)
+
+    def test_fields(self, atoms):
+        records, units = to_records(atoms, fields=["charge"])
+        assert records.dtype.names == ("charge",)
+
+        with pytest.raises(ValidationError):
+            from_records(Atom, records, units)
+
+    def test_validators(self, atoms):
+        class Checked(Atom):
+            @root_validator
+            def upper(cls, values):
+                return {**values, "name": values["name"].upper()}
+
+        records, units = to_records(atoms)
+        assert from_records(Checked, records, units)[2].name == "A2"
+
+        records["name"][2] = "a2"
+        assert from_records(Checked, records, units)[2].name == "A2"
+
+    def test_const(self, atoms):
+        class Constant(Atom):
+            name: str = Field("A0", const=True)
+
+        records, units = to_records(atoms[:1])
+        assert from_records(Constant, records, units)[0].name == "A0"
+
+        records, units = to_records(atoms)
+        with pytest.raises(ValidationError, match="const"):
+            from_records(Constant, records, units)
+
+    def test_invalid(self, atoms):
+        class Labelled(DefaultModel):
+            labels: list[str]
+
+        with pytest.raises(ValueError, match="not a quantity"):
+            to_records([Labelled(labels=["a"])])
+        with pytest.raises(ValueError, match="no models"):
+            to_records([])
+
+        records, units = to_records(atoms)
+        with pytest.raises(ValueError, match="no field"):
+            from_records(Labelled, records, units)
@@ -0,0 +1,953 @@
+import asyncio
+import copy
+import io
+import json
+import pickle
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+import pytest
+from openff.units import Quantity, unit
+
+from openff.models._pydantic import BaseModel, ValidationError
+from openff.models.models import DefaultModel, FrozenDefaultModel
+from openff.models.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    QuantityPool,
+    lazy_json_loader,
+)
+
+
+class TestCopyOnWrite:
+    @pytest.fixture
+    def model(self):
+        class System(DefaultModel):
+            temperature: FloatQuantity["kelvin"]
+            positions: ArrayQuantity["nanometer"]
+            velocities: ArrayQuantity["nanometer / picosecond"]
+
+            class Config:
+                copy_on_write = True
+
+        return System(
+            temperature=300.0,
+            positions=np.zeros((10, 3)),
+            velocities=np.ones((10, 3)),
+        )
+
+    @pytest.mark.parametrize(
+        "make_copy",
+        [
+            lambda m: m.copy(),
+            lambda m: m.copy(deep=True),
+            lambda m: m.copy(update={"temperature": 310.0 * unit.kelvin}, deep=True),
+            copy.deepcopy,
+        ],
+    )
+    def test_copies_share_buffers(self, model, make_copy):
+        copied = make_copy(model)
+
+        assert np.shares_memory(copied.positions.m, model.positions.m)
+        assert np.shares_memory(copied.velocities.m, model.velocities.m)
+
+        for m in (model, copied):
+            with pytest.raises(ValueError, match="read-only"):
+                m.positions[0] = [1.0, 1.0, 1.0] * unit.nanometer
+
+    @pytest.mark.parametrize("make_copy", [lambda m: m.copy(), copy.deepcopy])
+    def test_copies_do_not_freeze_caller_buffers(self, model, make_copy):
+        # Stored without a copy by validation, since it is already in the right unit
+        positions = np.zeros((10, 3)) * unit.nanometer
+        model.positions = positions
+
+        copied = make_copy(model)
+
+        assert positions.m.flags.writeable
+        assert np.shares_memory(copied.positions.m, model.positions.m)
+        assert not np.shares_memory(model.positions.m, positions.m)
+
+    def test_reassignment_does_not_affect_original(self, model):
+        copied = model.copy(deep=True)
+
+        copied.positions = np.ones((10, 3)) * unit.nanometer
+        copied.temperature = 310.0 * unit.kelvin
+
+        assert (model.positions.m == 0.0).all()
+        assert model.temperature == 300.0 * unit.kelvin
+
+    def test_make_writeable(self, model):
+        copied = copy.deepcopy(model)
+        copied.make_writeable("positions")
+
+        assert not np.shares_memory(copied.positions.m, model.positions.m)
+        assert np.shares_memory(copied.velocities.m, model.velocities.m)
+
+        copied.positions[0] = [1.0, 1.0, 1.0] * unit.nanometer
+
+        assert (model.positions.m == 0.0).all()
+        assert (copied.positions.m[0] == 1.0).all()
+
+    def test_disabled_by_default(self):
+        class System(DefaultModel):
+            positions: ArrayQuantity["nanometer"]
+
+        model = System(positions=np.zeros((10, 3)))
+
+        assert not np.shares_memory(copy.deepcopy(model).positions.m, model.positions.m)
+        assert model.positions.m.flags.writeable
+
+    def test_deepcopy_keeps_shared_references(self, model):
+        class Outer(DefaultModel):
+            inner: DefaultModel
+
+        outer = Outer(inner=model)
+        copied = copy.deepcopy([outer, outer.inner])
+
+        assert copied[0].inner is copied[1]
+        assert copied[1] is not model
+        assert np.shares_memory(copied[1].positions.m, model.positions.m)
+
+
+class Parameter(FrozenDefaultModel):
+    """A frozen model defined at module level, so that it can be pickled."""
+
+    name: str
+    sigma: FloatQuantity["nanometer"]
+    coefficients: ArrayQuantity["kilojoule / mole"]
+
+
+class TestFrozenDefaultModel:
+    @pytest.fixture
+    def model_class(self):
+        return Parameter
+
+    def test_immutable(self, model_class):
+        coefficients = np.array([1.0, 2.0])
+        parameter = model_class(name="foo", sigma=0.3, coefficients=coefficients)
+
+        with pytest.raises(TypeError, match="immutable"):
+            parameter.sigma = 0.4 * unit.nanometer
+
+        with pytest.raises(ValueError, match="read-only"):
+            parameter.coefficients[0] = 0.0 * unit.kilojoule / unit.mole
+
+        with pytest.raises(TypeError, match="immutable"):
+            parameter.make_writeable()
+
+        # the buffer of the input is not affected
+        assert coefficients.flags.writeable
+
+    def test_writing_to_source(self, model_class):
+        import array
+
+        # Stored without a copy by validation, since they are already in the right unit or
+        # wrap a buffer
+        quantity = np.zeros(3) * unit.kilojoule / unit.mole
+        buffer = array.array("d", [0.0, 0.0, 0.0])
+
+        for source, data in [(quantity, quantity.m), (buffer, buffer)]:
+            parameter = model_class(name="foo", sigma=0.3, coefficients=source)
+            expected = hash(parameter)
+
+            data[0] = 5.0
+            assert parameter.coefficients.m.tolist() == [0.0, 0.0, 0.0]
+            assert hash(parameter) == expected
+
+            view = parameter.coefficients.m.view()
+            with pytest.raises(ValueError, match="read-only"):
+                view[0] = 1.0
+
+    def test_hash_and_equality(self, model_class):
+        a = model_class(name="foo", sigma=0.3, coefficients=[1.0, 2.0])
+        b = model_class(name="foo", sigma=0.3, coefficients=np.array([1.0, 2.0]))
+        c = model_class(name="foo", sigma=0.3, coefficients=[1.0, 3.0])
+
+        assert a == b
+        assert hash(a) == hash(b)
+        assert a != c
+
+        assert len({a, b, c}) == 2
+        assert {a: "a"}[b] == "a"
+
+    def test_copies(self, model_class):
+        a = model_class(name="foo", sigma=0.3, coefficients=[1.0, 2.0])
+
+        assert copy.deepcopy(a) == a
+        assert np.shares_memory(copy.deepcopy(a).coefficients.m, a.coefficients.m)
+
+        updated = a.copy(update={"sigma": 0.4 * unit.nanometer})
+
+        assert updated != a
+        assert hash(updated) != hash(a)
+
+        unpickled = pickle.loads(pickle.dumps(a))
+
+        assert unpickled == a
+        assert hash(unpickled) == hash(a)
+
+    def test_nan_equal_to_nan(self, model_class):
+        a = model_class(name="foo", sigma=float("nan"), coefficients=[1.0, np.nan])
+        b = model_class(name="foo", sigma=float("nan"), coefficients=[1.0, np.nan])
+
+        assert a == a
+        assert a == b
+        assert hash(a) == hash(b)
+
+    def test_field_named_self(self):
+        class Atom(FrozenDefaultModel):
+            self: str
+
+        assert Atom(self="foo").self == "foo"
+
+
+class TestEquals:
+    @pytest.fixture
+    def model_class(self):
+        class Checkpoint(DefaultModel):
+            step: int
+            time: FloatQuantity["picosecond"]
+            positions: ArrayQuantity["nanometer"]
+            box: ArrayQuantity
+            tags: list
+
+        return Checkpoint
+
+    @pytest.fixture
+    def model(self, model_class):
+        return model_class(
+            step=10,
+            time=2.0,
+            positions=np.arange(12.0).reshape(4, 3),
+            box=np.eye(3) * unit.nanometer,
+            tags=["a", 1.0],
+        )
+
+    def test_equals(self, model, model_class):
+        same = model_class(
+            step=10,
+            time=2000.0 * unit.femtosecond,
+            positions=np.arange(12.0).reshape(4, 3) * unit.nanometer,
+            box=np.eye(3) * 10 * unit.angstrom,
+            tags=["a", 1.0],
+        )
+
+        assert model.equals(model.copy(deep=True))
+        assert model.equals(same, rtol=1e-12)
+        assert not model.equals(model.copy(update={"step": 11}))
+        assert not model.equals(1)
+
+    def test_tolerances(self, model):
+        nudged = model.copy(
+            update={"positions": model.positions + 1e-9 * unit.nanometer}
+        )
+
+        assert not model.equals(nudged)
+        assert model.equals(nudged, atol=1e-8)
+
+    def test_incompatible_values(self, model):
+        assert not model.equals(model.copy(update={"box": np.eye(3) * unit.second}))
+        assert not model.equals(
+            model.copy(update={"positions": np.zeros(3) * unit.nanometer})
+        )
+
+    def test_diff(self, model):
+        changed = model.copy(update={"step": 11, "box": np.eye(3) * 11 * unit.angstrom})
+
+        diff = model.diff(changed)
+
+        assert diff.keys() == {"step", "box"}
+        assert diff["step"] == (10, 11)
+        assert diff["box"][1] is changed.box
+
+        assert model.diff(model.copy(deep=True)) == {}
+
+        with pytest.raises(TypeError, match="Cannot diff"):
+            model.diff(Parameter(name="foo", sigma=0.3, coefficients=[1.0]))
+
+    def test_nan(self, model):
+        positions = model.positions.m.copy()
+        positions[0, 0] = np.nan
+        with_nan = model.copy(update={"positions": positions * unit.nanometer})
+
+        assert with_nan.equals(with_nan.copy(deep=True))
+        assert with_nan.equals(with_nan.copy(deep=True), atol=1e-8)
+        assert with_nan.diff(with_nan.copy(deep=True)) == {}
+        assert not model.equals(with_nan)
+
+    def test_partial(self, model, model_class):
+        # As loaded by `DefaultModel.load(fields=...)`
+        partial = model_class.construct(step=10)
+
+        assert not model.equals(partial)
+        assert not partial.equals(model)
+
+        diff = partial.diff(model)
+
+        assert "step" not in diff
+        assert diff["time"] == (None, model.time)
+        assert model.diff(partial)["time"] == (model.time, None)
+
+
+class TestCompiledInit:
+    class Model(DefaultModel):
+        name: str
+        count: int = 0
+        sigma: FloatQuantity["nanometer"]
+        cutoff: Optional[FloatQuantity["nanometer"]] = None
+        positions: ArrayQuantity["angstrom"]
+        values: ArrayQuantity = np.zeros(2) * unit.second
+        tags: list[str] = []
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"name": "a", "sigma": 0.3, "positions": np.ones((2, 3))},
+            {"name": "a", "sigma": 3, "positions": np.ones(3), "count": 2},
+            {
+                "name": "a",
+                "sigma": 3.0 * unit.angstrom,
+                "cutoff": 1.0,
+                "positions": [1.0, 2.0] * unit.nanometer,
+                "values": np.ones(2) * unit.minute,
+                "tags": ("x",),
+            },
+        ],
+    )
+    def test_matches_pydantic(self, data):
+        model = self.Model(**data)
+        expected = self.Model.__new__(self.Model)
+        BaseModel.__init__(expected, **data)
+
+        assert model.__fields_set__ == expected.__fields_set__
+        assert model.__dict__.keys() == expected.__dict__.keys()
+        assert model.equals(expected)
+        assert model.sigma.units == unit.nanometer
+
+    def test_array_is_copied(self):
+        positions = np.ones(3)
+        model = self.Model(name="a", sigma=0.3, positions=positions)
+
+        positions[0] = 2.0
+        assert model.positions.m[0] == 1.0
+
+    @pytest.mark.parametrize(
+        "data, match",
+        [
+            ({"sigma": 0.3, "positions": np.ones(3)}, "name\n  field required"),
+            ({"name": "a", "sigma": unit.second, "positions": np.ones(3)}, "sigma"),
+            ({"name": "a", "sigma": 0.3, "positions": np.ones(3), "extra": 1}, None),
+        ],
+    )
+    def test_falls_back_to_pydantic(self, data, match):
+        if match is None:
+            # Extra arguments are ignored, as by pydantic
+            assert "extra" not in self.Model(**data).__dict__
+        else:
+            with pytest.raises(ValidationError, match=match):
+                self.Model(**data)
+
+    def test_const_fields(self):
+        from openff.models._pydantic import Field
+
+        class Model(DefaultModel):
+            version: int = Field(3, const=True)
+            sigma: FloatQuantity["nanometer"] = Field(1.0, const=True)
+
+        assert Model(version=3).version == 3
+        with pytest.raises(ValidationError, match="version"):
+            Model(version=4)
+
+        model = Model()
+        with pytest.raises(ValidationError, match="version"):
+            model.version = 5
+        with pytest.raises(ValidationError, match="sigma"):
+            model.sigma = 2.0
+
+    def test_root_validators(self):
+        from openff.models._pydantic import root_validator
+
+        class Model(DefaultModel):
+            sigma: FloatQuantity["nanometer"]
+
+            @root_validator
+            def double(cls, values):
+                return {"sigma": 2 * values["sigma"]}
+
+        assert Model(sigma=1.0).sigma == 2.0 * unit.nanometer
+
+
+class TestAssignment:
+    class Model(DefaultModel):
+        time: FloatQuantity["picosecond"]
+        positions: ArrayQuantity["nanometer"]
+
+    @pytest.fixture
+    def model(self):
+        return self.Model(time=1.0, positions=np.zeros((2, 3)))
+
+    def test_same_unit_is_not_copied(self, model):
+        other = self.Model(time=model.time, positions=model.positions)
+        assert other.time is model.time
+        assert other.positions is model.positions
+
+        time = 2.0 * unit.picosecond
+        model.time = time
+        assert model.time is time
+
+    def test_other_values_are_validated(self, model):
+        model.time = 2
+        assert model.time == 2.0 * unit.picosecond
+        assert type(model.time.m) is float
+
+        model.time = 1.0 * unit.nanosecond
+        assert model.time.units == unit.picosecond
+        assert model.time.m == pytest.approx(1000.0)
+
+        model.positions = np.ones(3, dtype=np.int32) * unit.angstrom
+        assert model.positions.units == unit.nanometer
+        assert model.__fields_set__ == {"time", "positions"}
+
+        with pytest.raises(ValidationError):
+            model.time = 1.0 * unit.nanometer
+
+
+class TestInterning:
+    class Atom(DefaultModel):
+        sigma: FloatQuantity["nanometer"]
+        charge: Optional[FloatQuantity["elementary_charge"]] = None
+
+        class Config:
+            intern_quantities = True
+
+    def test_equal_values_are_shared(self):
+        atoms = [self.Atom(sigma=0.3, charge=-0.1 * (i % 2)) for i in range(10)]
+
+        assert len({id(atom.sigma) for atom in atoms}) == 1
+        assert atoms[0].charge is atoms[2].charge
+        assert atoms[0].equals(atoms[2])
+
+        atoms[1].sigma = 0.4
+        assert atoms[1].sigma is not atoms[0].sigma
+        # Converted to nanometers by pydantic, and then interned
+        atoms[1].sigma = 3.0 * unit.angstrom
+        assert atoms[1].sigma is atoms[0].sigma
+
+    def test_root_validators(self):
+        from openff.models._pydantic import root_validator
+
+        class Atom(self.Atom):
+            @root_validator
+            def check(cls, values):
+                return values
+
+        atoms = [Atom(sigma=0.3) for _ in range(3)]
+        assert atoms[0].sigma is atoms[1].sigma
+
+        atoms[2].sigma = 0.4
+        atoms[1].sigma = 0.4
+        assert atoms[1].sigma is atoms[2].sigma
+
+    def test_not_interned_by_default(self):
+        assert Parameter.__config__.intern_quantities is False
+
+        class Model(DefaultModel):
+            sigma: FloatQuantity["nanometer"]
+
+        assert Model(sigma=0.3).sigma is not Model(sigma=0.3).sigma
+
+    def test_pool(self):
+        pool = QuantityPool(maxsize=2)
+        zero = 0.0 * unit.nanometer
+
+        assert pool.intern(zero) is zero
+        assert pool.intern(0.0 * unit.nanometer) is zero
+        assert pool.intern(-0.0 * unit.nanometer) is not zero
+        assert pool.intern(0.0 * unit.angstrom) is not zero
+
+        nan = float("nan") * unit.nanometer
+        assert pool.intern(nan) is nan
+        assert pool.intern(np.zeros(2) * unit.nanometer) is not zero
+
+        # The least recently used value is evicted
+        one = pool.intern(1.0 * unit.nanometer)
+        assert len(pool) == 2
+        assert pool.intern(0.0 * unit.nanometer) is not zero
+        assert pool.intern(1.0 * unit.nanometer) is one
+
+        pool.clear()
+        assert len(pool) == 0
+
+
+class TestSerializer:
+    def test_matches_generic_path(self):
+        class Inner(DefaultModel):
+            x: FloatQuantity["nanometer"]
+
+        class Model(DefaultModel):
+            name: str
+            count: int
+            ratio: float
+            energy: FloatQuantity["kilojoule / mole"]
+            positions: ArrayQuantity["nanometer"]
+            values: ArrayQuantity
+            cutoff: Optional[FloatQuantity["nanometer"]] = None
+            inner: Inner
+            items: list = []
+
+        model = Model(
+            name='caf\u00e9 "quoted"',
+            count=3,
+            ratio=float("nan"),
+            energy=1.5,
+            positions=np.arange(6).reshape(2, 3),
+            values=np.ones(2, dtype=np.float32) * unit.angstrom,
+            inner=Inner(x=1.0),
+            items=[1, "a", None, 2.5 * unit.second],
+        )
+
+        assert model.json() == BaseModel.json(model)
+        assert model.json() == model.json(exclude_none=False)
+
+    def test_custom_encoder_falls_back(self):
+        class Model(DefaultModel):
+            energy: FloatQuantity["kilojoule / mole"]
+
+            class Config:
+                json_encoders = {Quantity: lambda val: str(val)}
+
+        assert Model(energy=1.0).json() == '{"energy": "1.0 kilojoule / mole"}'
+
+
+class TestDumpJSON:
+    @pytest.fixture
+    def model_class(self):
+        class Trajectory(DefaultModel):
+            name: str
+            time: FloatQuantity["picosecond"]
+            frames: ArrayQuantity["nanometer"]
+            counts: ArrayQuantity["dimensionless"]
+            extra: dict
+
+        return Trajectory
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 7, 65536])
+    def test_matches_json(self, model_class, chunk_size):
+        m = model_class(
+            name='a "quoted" name',
+            time=2.0,
+            frames=np.random.default_rng(0).random((3, 4, 3)),
+            counts=np.array([np.nan, np.inf, 1.0]) * unit.dimensionless,
+            extra={"a": [1, 2.5]},
+        )
+
+        fp = io.StringIO()
+        m.dump_json(fp, chunk_size=chunk_size)
+
+        assert fp.getvalue() == m.json()
+
+        parsed = model_class.parse_raw(fp.getvalue())
+        assert np.array_equal(parsed.frames.m, m.frames.m)
+
+    def test_constant_memory(self, model_class):
+        class NullWriter:
+            def write(self, data):
+                pass
+
+        m = model_class(
+            name="big",
+            time=2.0,
+            frames=np.zeros((10_000, 3)),
+            counts=np.zeros(100_000),
+            extra={},
+        )
+
+        tracemalloc.start()
+        try:
+            m.dump_json(NullWriter(), chunk_size=1000)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # the arrays themselves take 1 MB; building their lists would take several
+        assert peak < 200_000
+
+
+class TestLoadJSON:
+    @pytest.fixture
+    def model_class(self):
+        class Trajectory(DefaultModel):
+            name: str
+            time: FloatQuantity["picosecond"]
+            frames: ArrayQuantity["nanometer"]
+            counts: ArrayQuantity
+            empty: ArrayQuantity["second"]
+            extra: dict
+
+        return Trajectory
+
+    @pytest.mark.parametrize(
+        "shape", [(5,), (3, 4), (2, 3, 4), (2, 1, 3, 2), (2, 0), (2, 1, 0), (3, 2, 0)]
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+    @pytest.mark.parametrize("binary", [True, False])
+    def test_matches_parse_raw(self, model_class, shape, chunk_size, binary):
+        m = model_class(
+            name='a "quoted" name',
+            time=2.0,
+            frames=np.random.default_rng(0).random(shape),
+            counts=np.arange(np.prod(shape)).reshape(shape) * unit.dimensionless,
+            empty=[],
+            extra={"a": [1, 2.5]},
+        )
+
+        text = m.json()
+        fp = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+
+        loaded = model_class.load_json(fp, chunk_size=chunk_size)
+        parsed = model_class.parse_raw(text)
+
+        assert loaded.equals(parsed)
+        for name in ["frames", "counts", "empty"]:
+            assert getattr(loaded, name).shape == getattr(parsed, name).shape
+            assert getattr(loaded, name).m.dtype == getattr(parsed, name).m.dtype
+
+    def test_special_values(self, model_class):
+        m = model_class(
+            name="foo",
+            time=2.0,
+            frames=[np.nan, np.inf, -np.inf, 1e-300],
+            counts=[-1, 0] * unit.dimensionless,
+            empty=[],
+            extra={},
+        )
+
+        loaded = model_class.load_json(io.StringIO(m.json()), chunk_size=2)
+
+        assert np.array_equal(loaded.frames.m, m.frames.m, equal_nan=True)
+        assert loaded.counts.m.dtype == np.int64
+
+    @staticmethod
+    def counts_document(counts: str) -> str:
+        """Write a document by hand, since validation would not keep large integers."""
+        quantity = json.dumps('{"val": [' + counts + '], "unit": "dimensionless"}')
+        fields = '"name": "foo", "time": 2.0, "frames": [], "empty": [], "extra": {}'
+        return f'{{{fields}, "counts": {quantity}}}'
+
+    @pytest.mark.parametrize(
+        "counts",
+        [
+            "9223372036854775813, 18446744073709551615",
+            "1, 2, 9223372036854775813",
+            "-1, 2, 9223372036854775813",
+            "9223372036854775813, 2, -1",
+            "9223372036854775807, -9223372036854775808",
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 1000])
+    def test_large_integers(self, model_class, counts, chunk_size):
+        text = self.counts_document(counts)
+
+        loaded = model_class.load_json(io.StringIO(text), chunk_size=chunk_size)
+        parsed = model_class.parse_raw(text)
+
+        assert loaded.counts.m.dtype == parsed.counts.m.dtype
+        assert loaded.counts.m.tolist() == parsed.counts.m.tolist()
+
+    def test_integers_out_of_range(self, model_class):
+        text = self.counts_document("18446744073709551616")
+
+        with pytest.raises(ValueError, match="out of the range"):
+            model_class.load_json(io.StringIO(text))
+
+    def test_truncated(self, model_class):
+        m = model_class(
+            name="foo",
+            time=2.0,
+            frames=np.zeros((10, 3)),
+            counts=[1] * unit.dimensionless,
+            empty=[],
+            extra={},
+        )
+
+        with pytest.raises(ValueError, match="Unexpected end"):
+            model_class.load_json(io.StringIO(m.json()[:100]), chunk_size=16)
+
+
+class TestJSONLines:
+    @pytest.fixture
+    def model_class(self):
+        class Record(DefaultModel):
+            id: int
+            charge: FloatQuantity["elementary_charge"]
+            sigma: FloatQuantity["nanometer"]
+            coefficients: ArrayQuantity["kilojoule / mole"]
+
+        return Record
+
+    @pytest.fixture
+    def records(self, model_class):
+        return (
+            model_class(id=i, charge=0.1 * i, sigma=0.3, coefficients=[1.0, i])
+            for i in range(10)
+        )
+
+    @pytest.mark.parametrize("validate", [True, False])
+    def test_roundtrip(self, model_class, records, validate):
+        records = list(records)
+
+        fp = io.StringIO()
+        model_class.write_jsonl(iter(records), fp)
+
+        assert len(fp.getvalue().splitlines()) == 10
+
+        fp.seek(0)
+        loaded = model_class.iter_jsonl(fp, validate=validate)
+
+        assert not isinstance(loaded, list)
+
+        loaded = list(loaded)
+
+        assert len(loaded) == 10
+        for original, parsed in zip(records, loaded):
+            assert original.equals(parsed)
+
+    def test_binary_and_blank_lines(self, model_class, records):
+        fp = io.StringIO()
+        model_class.write_jsonl(records, fp)
+
+        data = fp.getvalue().replace("\n", "\n\n").encode()
+
+        assert len(list(model_class.iter_jsonl(io.BytesIO(data)))) == 10
+
+
+class TestCollection:
+    @pytest.fixture
+    def model_class(self):
+        class Record(DefaultModel):
+            id: int
+            charge: FloatQuantity["elementary_charge"]
+            k: FloatQuantity["kilojoule / mole / nanometer ** 2"]
+            coefficients: ArrayQuantity
+            tags: dict = dict()
+
+        return Record
+
+    def test_roundtrip(self, model_class):
+        records = [
+            model_class(
+                id=i,
+                charge=0.1 * i,
+                k=1000.0,
+                coefficients=[1.0, i] * (unit.angstrom if i % 2 else unit.nanometer),
+                tags={"i": i},
+            )
+            for i in range(10)
+        ]
+
+        fp = io.StringIO()
+        model_class.dump_collection(records, fp)
+
+        data = json.loads(fp.getvalue())
+
+        assert data["units"] == [
+            "elementary_charge",
+            "kilojoule / mole / nanometer ** 2",
+            "nanometer",
+            "angstrom",
+        ]
+        assert data["models"][1]["coefficients"] == {"val": [1.0, 1.0], "unit": 3}
+        assert data["models"][1]["tags"] == {"i": 1}
+
+        fp.seek(0)
+        loaded = model_class.load_collection(fp)
+
+        assert len(loaded) == 10
+        for original, parsed in zip(records, loaded):
+            assert original.equals(parsed)
+            assert original.coefficients.units == parsed.coefficients.units
+
+    def test_empty(self, model_class):
+        fp = io.StringIO()
+        model_class.dump_collection([], fp)
+
+        assert json.loads(fp.getvalue()) == {"units": [], "models": []}
+
+
+class TestPartialLoad:
+    @pytest.fixture
+    def model_class(self):
+        class Checkpoint(DefaultModel):
+            step: int
+            time: FloatQuantity["picosecond"]
+            box_vectors: ArrayQuantity["nanometer"]
+            positions: ArrayQuantity
+            tags: list[str] = []
+
+        return Checkpoint
+
+    @pytest.fixture
+    def checkpoint(self, model_class):
+        return model_class(
+            step=100,
+            time=0.2,
+            box_vectors=np.eye(3) * 4.0,
+            positions=np.arange(30, dtype=np.float32).reshape(10, 3) * unit.angstrom,
+            tags=["equilibrated"],
+        )
+
+    def test_roundtrip(self, tmp_path, model_class, checkpoint):
+        checkpoint.save(tmp_path / "checkpoint.bin")
+        loaded = model_class.load(tmp_path / "checkpoint.bin")
+
+        assert loaded.equals(checkpoint)
+        assert loaded.positions.m.dtype == np.float32
+        assert loaded.positions.units == unit.angstrom
+
+        loaded.positions.m[0] = 1.0
+
+    def test_load_fields(self, tmp_path, model_class, checkpoint, monkeypatch):
+        checkpoint.save(tmp_path / "checkpoint.bin")
+
+        def fail(data):
+            raise AssertionError("Decoded an array which was not requested")
+
+        monkeypatch.setattr("openff.models._binary.array_from_bytes", fail)
+        loaded = model_class.load(tmp_path / "checkpoint.bin", fields=["step", "time"])
+
+        assert loaded.step == 100
+        assert loaded.time == 0.2 * unit.picosecond
+        assert loaded.__fields_set__ == {"step", "time"}
+        assert loaded.tags == []
+        assert not hasattr(loaded, "positions")
+
+    def test_load_fields_validates(self, tmp_path, model_class, checkpoint):
+        checkpoint.save(tmp_path / "checkpoint.bin")
+
+        class Other(DefaultModel):
+            step: str
+            box_vectors: ArrayQuantity["picosecond"]
+
+        with pytest.raises(ValidationError, match="box_vectors"):
+            Other.load(tmp_path / "checkpoint.bin", fields=["step", "box_vectors"])
+        with pytest.raises(ValueError, match="no field"):
+            model_class.load(tmp_path / "checkpoint.bin", fields=["velocities"])
+
+    def test_not_a_checkpoint(self, tmp_path, model_class, checkpoint):
+        (tmp_path / "checkpoint.json").write_text(checkpoint.json())
+        with pytest.raises(ValueError, match="not written by DefaultModel.save"):
+            model_class.load(tmp_path / "checkpoint.json")
+
+
+class TestLazy:
+    class Frames(DefaultModel):
+        step: int
+        positions: ArrayQuantity["nanometer"]
+        forces: ArrayQuantity
+
+    class LazyFrames(Frames):
+        class Config:
+            json_loads = lazy_json_loader
+
+    @pytest.fixture
+    def frames(self):
+        return self.Frames(
+            step=3,
+            positions=np.arange(12, dtype=float).reshape(4, 3),
+            forces=np.ones((4, 3)) * unit.kilojoule_per_mole / unit.angstrom,
+        )
+
+    def test_binary(self, tmp_path, frames):
+        frames.save(tmp_path / "frames.bin")
+        loaded = self.Frames.load(tmp_path / "frames.bin", lazy=True)
+
+        assert not loaded.positions.is_decoded
+        assert not loaded.forces.is_decoded
+        assert loaded.forces.units == unit.kilojoule_per_mole / unit.angstrom
+
+        assert np.array_equal(loaded.positions.m, frames.positions.m)
+        assert loaded.positions.is_decoded
+        assert loaded.positions.m is loaded.positions.m
+        assert not loaded.forces.is_decoded
+        assert loaded.equals(frames)
+
+    def test_conversion_deferred(self, tmp_path, frames):
+        class Angstroms(DefaultModel):
+            step: int
+            positions: ArrayQuantity["angstrom"]
+            forces: ArrayQuantity
+
+        frames.save(tmp_path / "frames.bin")
+        loaded = Angstroms.load(tmp_path / "frames.bin", lazy=True)
+
+        assert not loaded.positions.is_decoded
+        assert loaded.positions.units == unit.angstrom
+        assert np.allclose(loaded.positions.m, 10 * frames.positions.m)
+
+    def test_json(self, frames):
+        loaded = self.LazyFrames.parse_raw(frames.json())
+
+        assert not loaded.positions.is_decoded
+        assert loaded.json() == frames.json()
+        assert loaded.positions.is_decoded
+
+    def test_frozen(self, tmp_path):
+        Parameter(name="x", sigma=0.3, coefficients=np.arange(3, dtype=float)).save(
+            tmp_path / "parameter.bin"
+        )
+        loaded = Parameter.load(tmp_path / "parameter.bin", lazy=True)
+
+        assert not loaded.coefficients.is_decoded
+        assert not loaded.coefficients.m.flags.writeable
+
+
+class TestAsync:
+    def test_save_and_load(self, tmp_path):
+        models = [
+            Parameter(name=str(i), sigma=0.3, coefficients=np.arange(i, dtype=float))
+            for i in range(8)
+        ]
+        paths = [tmp_path / f"{i}.json" for i in range(8)]
+
+        async def roundtrip():
+            limit = asyncio.Semaphore(2)
+            await asyncio.gather(
+                *(m.asave(path, limit=limit) for m, path in zip(models, paths))
+            )
+            return await asyncio.gather(*(Parameter.aload(path) for path in paths))
+
+        assert asyncio.run(roundtrip()) == models
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 256])
+    def test_aiter_jsonl(self, tmp_path, batch_size):
+        models = [
+            Parameter(name=str(i), sigma=0.3, coefficients=[1.0, i]) for i in range(10)
+        ]
+        with open(tmp_path / "models.jsonl", "w") as fp:
+            Parameter.write_jsonl(models, fp)
+
+        async def collect():
+            return [
+                m
+                async for m in Parameter.aiter_jsonl(
+                    tmp_path / "models.jsonl", batch_size=batch_size
+                )
+            ]
+
+        assert asyncio.run(collect()) == models
+
+    def test_aiter_jsonl_stop_early(self, tmp_path):
+        with open(tmp_path / "models.jsonl", "w") as fp:
+            Parameter.write_jsonl(
+                (Parameter(name=str(i), sigma=0.3, coefficients=[]) for i in range(10)),
+                fp,
+            )
+
+        async def first():
+            iterator = Parameter.aiter_jsonl(tmp_path / "models.jsonl", batch_size=2)
+            async for m in iterator:
+                await iterator.aclose()
+                return m
+
+        assert asyncio.run(first()).name == "0"
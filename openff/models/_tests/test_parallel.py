@@ -0,0 +1,107 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from openff.units import unit
+
+from openff.models.models import DefaultModel, FrozenDefaultModel
+from openff.models.parallel import dump_files, dump_models, load_directory, parse_models
+from openff.models.types import ArrayQuantity, FloatQuantity
+
+
+class Record(DefaultModel):
+    """A model defined at module level, so that it can be sent to other processes."""
+
+    id: int
+    charge: FloatQuantity["elementary_charge"]
+    coefficients: ArrayQuantity["kilojoule / mole"]
+
+
+class FrozenRecord(FrozenDefaultModel):
+    id: int
+    coefficients: ArrayQuantity["kilojoule / mole"]
+
+
+@pytest.fixture(params=["threads", "processes"])
+def executor(request):
+    executor_class = {
+        "threads": ThreadPoolExecutor,
+        "processes": ProcessPoolExecutor,
+    }[request.param]
+
+    with executor_class(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture
+def records():
+    return [
+        Record(id=i, charge=0.1 * i, coefficients=np.arange(i, dtype=float))
+        for i in range(20)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_roundtrip(executor, records, chunk_size):
+    documents = list(dump_models(records, executor=executor, chunk_size=chunk_size))
+
+    assert documents == [record.json() for record in records]
+
+    parsed = list(
+        parse_models(Record, documents, executor=executor, chunk_size=chunk_size)
+    )
+
+    assert len(parsed) == len(records)
+    for original, copy in zip(records, parsed):
+        assert original.equals(copy)
+
+
+def test_unordered(executor, records):
+    documents = dump_models(records, executor=executor, chunk_size=2, ordered=False)
+
+    parsed = parse_models(Record, documents, executor=executor, ordered=False)
+
+    assert sorted(record.id for record in parsed) == list(range(20))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_bounded_submission(records, ordered):
+    consumed = list()
+
+    def generate():
+        for record in records:
+            consumed.append(record.id)
+            yield record
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        documents = dump_models(
+            generate(), executor=executor, chunk_size=1, ordered=ordered
+        )
+        next(documents)
+        # Two chunks per worker are in flight, and are replaced as they complete
+        assert len(consumed) <= 8
+
+        assert len(list(documents)) == 19
+
+
+def test_files(executor, records, tmp_path):
+    dump_files(
+        records,
+        [tmp_path / f"{record.id:03d}.json" for record in records],
+        executor=executor,
+        chunk_size=4,
+    )
+
+    loaded = list(load_directory(Record, tmp_path, executor=executor))
+
+    assert [record.id for record in loaded] == list(range(20))
+    assert loaded[5].coefficients.units == unit.kilojoule / unit.mole
+
+
+def test_frozen_models_stay_frozen(executor):
+    records = [FrozenRecord(id=i, coefficients=[1.0, 2.0]) for i in range(3)]
+
+    parsed = list(parse_models(FrozenRecord, dump_models(records, executor=executor)))
+
+    assert parsed == records
+    assert not parsed[0].coefficients.m.flags.writeable
@@ -0,0 +1,129 @@
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+from openff.units import unit
+
+from openff.models.models import DefaultModel
+from openff.models.store import ModelStore
+from openff.models.types import ArrayQuantity, FloatQuantity
+
+
+class Atom(DefaultModel):
+    name: str
+    index: int
+    charge: FloatQuantity["elementary_charge"]
+    coefficients: ArrayQuantity["kilojoule / mole"]
+    mass: FloatQuantity
+    positions: ArrayQuantity
+    tags: list[str] = []
+
+
+@pytest.fixture
+def atoms():
+    return [
+        Atom(
+            name=f"A{i}",
+            index=i,
+            charge=(i - 5) * 0.1 * unit.elementary_charge,
+            coefficients=np.arange(i, dtype=float) * unit.kilojoule_per_mole,
+            mass=i * unit.dalton,
+            positions=np.full((2, 3), i, dtype=np.float32) * unit.angstrom,
+            tags=["x"] * (i % 2),
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.fixture
+def store(atoms):
+    store = ModelStore(Atom, sqlite3.connect(":memory:"))
+    store.insert(atoms)
+    return store
+
+
+class TestModelStore:
+    def test_roundtrip(self, store, atoms):
+        assert len(store) == 10
+        loaded = list(store.select())
+        assert all(a.equals(b) for a, b in zip(atoms, loaded))
+        assert loaded[3].positions.m.dtype == np.float32
+        assert loaded[3].positions.m.shape == (2, 3)
+
+    def test_columns(self, store):
+        columns = {
+            name: type_
+            for _, name, type_, *_ in store.connection.execute(
+                'PRAGMA table_info("Atom")'
+            )
+        }
+        assert columns["charge"] == "REAL"
+        assert columns["coefficients"] == "BLOB"
+        assert "charge__unit" not in columns
+        assert columns["mass__unit"] == "TEXT"
+
+    def test_range_query_converts_units(self, store):
+        selected = store.select(
+            charge=(-0.5 * unit.elementary_charge, 0.05 * unit.elementary_charge)
+        )
+        assert [atom.index for atom in selected] == [0, 1, 2, 3, 4, 5]
+
+        coulombs = (0.15 * unit.elementary_charge).to(unit.coulomb)
+        assert store.count(charge=(coulombs, None)) == 3
+
+    def test_query_without_declared_unit(self, store):
+        assert store.count(mass=(2 * unit.dalton, 4 * unit.dalton)) == 3
+        assert store.count(mass=(2 * unit.dalton, 4 * unit.kilogram)) == 8
+
+    def test_equality_query(self, store):
+        (atom,) = store.select(name="A7")
+        assert atom.index == 7
+        assert store.count(index=3, name="A3") == 1
+
+    def test_index(self, store):
+        store.create_index("charge")
+        plan = store.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM "Atom" WHERE "charge" >= ?', (0.0,)
+        ).fetchall()
+        assert "ix_Atom_charge" in str(plan)
+
+        with pytest.raises(ValueError, match="array"):
+            store.create_index("coefficients")
+
+    def test_invalid_queries(self, store):
+        with pytest.raises(ValueError, match="no field"):
+            store.count(foo=1)
+        with pytest.raises(ValueError, match="quantities"):
+            store.count(charge=(0.0, 1.0))
+        with pytest.raises(ValueError, match="range"):
+            store.count(name=("a", "b", "c"))
+
+    def test_reopen(self, tmp_path, atoms):
+        ModelStore(Atom, tmp_path / "atoms.db").insert(atoms)
+        store = ModelStore(Atom, tmp_path / "atoms.db")
+        assert store.count(index=(None, 4)) == 5
+
+    def test_id_field(self):
+        class Record(DefaultModel):
+            id: int
+            value: FloatQuantity["second"]
+
+        store = ModelStore(Record, sqlite3.connect(":memory:"))
+        store.insert([Record(id=7, value=1.0), Record(id=3, value=2.0)])
+
+        assert [record.id for record in store.select()] == [7, 3]
+        assert store.count(id=3) == 1
+
+    def test_json_encoders(self):
+        class Tagged(DefaultModel):
+            tags: list[complex]
+
+            class Config:
+                json_encoders = {complex: lambda val: [val.real, val.imag]}
+
+        store = ModelStore(Tagged, sqlite3.connect(":memory:"))
+        store.insert([Tagged(tags=[1 + 2j])])
+
+        (data,) = store.connection.execute('SELECT "tags" FROM "Tagged"').fetchone()
+        assert json.loads(data) == [[1.0, 2.0]]
@@ -7,7 +7,15 @@ from openff.utilities.testing import skip_if_missing
 
 from openff.models.exceptions import UnitValidationError
 from openff.models.models import DefaultModel
-from openff.models.types import ArrayQuantity, FloatQuantity
+from openff.models.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    StrictArrayQuantity,
+    StrictFloatQuantity,
+    _to_omm_quantity,
+    array_from_bytes,
+    array_to_bytes,
+)
 
 try:
     from pydantic.v1 import ValidationError
@@ -164,6 +172,124 @@ class TestQuantityTypes:
             BoxModel(box_vectors=as_array).box_vectors,
         )
 
+    def test_array_quantity_buffers(self):
+        import array
+        import ctypes
+
+        class Model(DefaultModel):
+            data: ArrayQuantity["nanometer"]
+
+        class Interface:
+            def __init__(self, array):
+                self.__array_interface__ = array.__array_interface__
+
+        buffer = array.array("d", [1.0, 2.0, 3.0])
+        model = Model(data=buffer)
+        assert model.data.units == unit.nanometer
+        assert model.data.m.dtype == np.float64
+
+        # The buffer is wrapped, not copied
+        buffer[0] = 4.0
+        assert model.data.m[0] == 4.0
+
+        c_array = (ctypes.c_int32 * 2)(5, 6)
+        assert Model(data=c_array).data.m.tolist() == [5, 6]
+        assert Model(data=memoryview(buffer)).data.m.tolist() == [4.0, 2.0, 3.0]
+        assert Model(data=(1.0, 2.0)).data.m.tolist() == [1.0, 2.0]
+
+        source = np.eye(3)
+        model = Model(data=Interface(source))
+        assert np.shares_memory(model.data.m, source)
+
+        with pytest.raises(ValidationError):
+            Model(data=Interface(np.array(["a", "b"])))
+        with pytest.raises(ValidationError):
+            Model(data=object())
+
+    @pytest.mark.parametrize("dtype", ["<f8", ">f4", "<i2", "u1", "<c16"])
+    def test_array_quantity_bytes(self, dtype):
+        class Model(DefaultModel):
+            data: ArrayQuantity["nanometer"]
+
+        array = np.arange(24).reshape(2, 3, 4).astype(dtype)
+        model = Model(data=array_to_bytes(array))
+        assert model.data.m.dtype == np.dtype(dtype)
+        assert model.data.m.shape == (2, 3, 4)
+        assert np.array_equal(model.data.m, array)
+
+        # Bytearrays are decoded without copying
+        data = bytearray(array_to_bytes(array))
+        model = Model(data=data)
+        data[-array.itemsize :] = bytes(array.itemsize)
+        assert model.data.m[-1, -1, -1] == 0
+
+    @pytest.mark.parametrize("type_", [bytes, bytearray])
+    def test_array_quantity_legacy_bytes(self, type_):
+        class Model(DefaultModel):
+            data: ArrayQuantity["nanometer"]
+
+        data = type_(np.array([1, 2], dtype="<i8").tobytes())
+        assert Model(data=data).data.m.tolist() == [1, 2]
+
+    def test_array_bytes_invalid(self):
+        with pytest.raises(UnitValidationError, match="header"):
+            array_from_bytes(np.arange(3).tobytes())
+
+        data = bytearray(array_to_bytes(np.arange(3)))
+        data[4] = 2
+        with pytest.raises(UnitValidationError, match="version 2"):
+            array_from_bytes(data)
+
+        with pytest.raises(ValueError, match="object"):
+            array_to_bytes(np.array([None]))
+        with pytest.raises(ValueError, match="<U1"):
+            array_to_bytes(np.array(["a"]))
+
+        encoded = array_to_bytes(np.arange(3.0).reshape(1, 3))
+        for length in [9, 16, 24, len(encoded) - 1]:
+            with pytest.raises(UnitValidationError, match="truncated"):
+                array_from_bytes(encoded[:length])
+
+        data = bytearray(array_to_bytes(np.arange(3)))
+        data[8:11] = b"<U1"
+        with pytest.raises(UnitValidationError, match="dtype <U1"):
+            array_from_bytes(data)
+        data[8:11] = b"???"
+        with pytest.raises(UnitValidationError, match="dtype"):
+            array_from_bytes(data)
+
+    @skip_if_missing("openmm.unit")
+    def test_to_openmm(self):
+        import openmm.unit
+
+        class System(DefaultModel):
+            name: str
+            positions: ArrayQuantity["nanometer"]
+            energy: FloatQuantity["kilojoule / mole"]
+            frequency: FloatQuantity["hertz"]
+
+        positions = np.arange(30, dtype=float).reshape(10, 3)
+        system = System(name="water", positions=positions, energy=1.5, frequency=2.0)
+        converted = system.to_openmm()
+
+        assert set(converted) == {"positions", "energy", "frequency"}
+        assert converted["positions"].unit == openmm.unit.nanometer
+        # The array is wrapped, not copied
+        assert converted["positions"]._value is system.positions.m
+        assert converted["energy"] == 1.5 * openmm.unit.kilojoule_per_mole
+        # Hertz are missing from OpenMM, so are converted to base units
+        assert converted["frequency"] == 2.0 / openmm.unit.second
+
+        # Offset units are converted to base units with their offset
+        celsius = Quantity(1.5, unit.degree_Celsius)
+        assert _to_omm_quantity(celsius).value_in_unit(
+            openmm.unit.kelvin
+        ) == pytest.approx(274.65)
+
+        assert system.to_openmm("energy").keys() == {"energy"}
+        with pytest.raises(ValueError, match="quantity"):
+            system.to_openmm("name")
+
     @pytest.mark.parametrize("val", [True, 1])
     def test_bad_array_quantity_type(self, val):
         class Model(DefaultModel):
@@ -194,6 +320,59 @@ class TestQuantityTypes:
         assert type(subject.height.m) is float
         assert type(subject.doses.m) is np.ndarray
 
+    @skip_if_missing("unyt")
+    def test_unyt_conversion(self):
+        import unyt
+
+        class Atoms(DefaultModel):
+            positions: ArrayQuantity["nanometer"]
+            masses: ArrayQuantity["[mass]"]
+            energy: FloatQuantity["kilocalorie / mole"]
+            height: FloatQuantity["centimeter"]
+
+        positions = np.zeros((10, 3)) * unyt.nm
+        atoms = Atoms(
+            positions=positions,
+            masses=[1.0, 2.0] * unyt.g,
+            energy=2.0 * unyt.kcal / unyt.mol,
+            height=1.7 * unyt.m,
+        )
+
+        # Arrays already in the declared unit are views of the unyt array
+        assert np.shares_memory(atoms.positions.m, positions)
+        assert atoms.masses.units == unit.gram
+        assert atoms.energy == 2.0 * unit.kilocalorie / unit.mole
+        assert atoms.height.m == pytest.approx(170.0)
+
+        # Units missing from Pint are replaced by their MKS equivalents
+        atoms.masses = [1.0] * unyt.Msun
+        assert atoms.masses.units == unit.kilogram
+        assert atoms.masses.m == pytest.approx([1.988e30], rel=1e-3)
+
+        with pytest.raises(ValidationError):
+            atoms.height = 1.0 * unyt.s
+
+    @skip_if_missing("unyt")
+    def test_unyt_offset_units(self):
+        import unyt
+
+        class Sample(DefaultModel):
+            temperature: FloatQuantity["kelvin"]
+            readings: ArrayQuantity["[temperature]"]
+
+        # Degrees Fahrenheit are missing from Pint, so are converted to kelvin with their offset
+        sample = Sample(
+            temperature=32.0 * unyt.degF,
+            readings=[0.0, 100.0] * unyt.degC,
+        )
+        assert sample.temperature.m == pytest.approx(273.15)
+        assert sample.readings.units == unit.degree_Celsius
+        assert sample.readings.m.tolist() == [0.0, 100.0]
+
+        sample.readings = [32.0, 212.0] * unyt.degF
+        assert sample.readings.units == unit.kelvin
+        assert sample.readings.m == pytest.approx([273.15, 373.15])
+
     @skip_if_missing("unyt")
     @skip_if_missing("openmm.unit")
     def test_setters(self):
@@ -282,6 +461,139 @@ class TestQuantityTypes:
         with pytest.raises(ValidationError, match="1 validation error for Model"):
             m.lengths = 1 * unit.joule
 
+    def test_dimension_only_quantities(self):
+        class Model(DefaultModel):
+            length: FloatQuantity["[length]"]
+            positions: ArrayQuantity["[length]"]
+            velocities: ArrayQuantity[
+                unit.nanometer.dimensionality / unit.second.dimensionality
+            ]
+
+        positions = np.array([[0.0, 1.0, 2.0]]) * unit.angstrom
+
+        m = Model(
+            length="4 angstrom",
+            positions=positions,
+            velocities=[1.0, 2.0] * unit.meter / unit.second,
+        )
+
+        # values are kept in the units they were given in, without a copy
+        assert m.length.units == unit.angstrom
+        assert isinstance(m.length.m, float)
+        assert m.positions is positions
+        assert m.velocities.units == unit.meter / unit.second
+
+        with pytest.raises(ValidationError, match=r"dimensionality \[length\]"):
+            Model(
+                length=1.0 * unit.second, positions=positions, velocities=[] * unit.nm
+            )
+
+        with pytest.raises(ValidationError, match=r"Value 4.0 .*a unit.*"):
+            m.length = 4.0
+
+        with pytest.raises(ValidationError, match=r".*Value \[4.0\].*a unit.*"):
+            m.positions = [4.0]
+
+    def test_strict_quantities(self):
+        class Model(DefaultModel):
+            time: StrictFloatQuantity["picosecond"]
+            lengths: StrictArrayQuantity["nanometer"]
+
+        lengths = np.array([0.3, 0.5]) * unit.nanometer
+
+        m = Model(time=2 * unit.picosecond, lengths=lengths)
+
+        assert m.lengths is lengths
+        assert isinstance(m.time.m, float)
+
+        with pytest.raises(ValidationError, match=r"found units of femtosecond"):
+            m.time = 2000.0 * unit.femtosecond
+
+        with pytest.raises(ValidationError, match=r"found data of type .*list"):
+            m.lengths = [0.3, 0.5]
+
+        with pytest.raises(TypeError, match="requires a unit"):
+            StrictArrayQuantity["[length]"]
+
+
+@skip_if_missing("pydantic_core")
+class TestPydanticV2:
+    @pytest.fixture
+    def model(self):
+        from pydantic import BaseModel
+
+        class Molecule(BaseModel):
+            mass: FloatQuantity["atomic_mass_constant"]
+            charges: ArrayQuantity["elementary_charge"]
+            other: FloatQuantity
+            positions: ArrayQuantity["[length]"]
+
+        return Molecule
+
+    def test_validation(self, model):
+        m = model(
+            mass=16,
+            charges=np.asarray([-1, 0.5, 0.5]),
+            other=2.0 * unit.nanometer,
+            positions=[[0.0, 1.0, 2.0]] * unit.angstrom,
+        )
+
+        assert m.mass == 16.0 * unit.atomic_mass_constant
+        assert isinstance(m.mass.m, float)
+        assert m.charges.units == unit.elementary_charge
+        assert m.positions.units == unit.angstrom
+
+        with pytest.raises(
+            ValueError, match=r"Could not validate data of type .*bool.*"
+        ):
+            model(
+                mass=True,
+                charges=[],
+                other=2.0 * unit.nanometer,
+                positions=[] * unit.nanometer,
+            )
+
+    def test_json_roundtrip(self, model):
+        m = model(
+            mass=16.0 * unit.atomic_mass_constant,
+            charges=[-1.0, 0.5, 0.5] * unit.elementary_charge,
+            other=2.0 * unit.nanometer,
+            positions=[[0.0, 1.0, 2.0]] * unit.angstrom,
+        )
+
+        assert json.loads(m.model_dump_json()) == {
+            "mass": {"val": 16.0, "unit": "atomic_mass_constant"},
+            "charges": {"val": [-1.0, 0.5, 0.5], "unit": "elementary_charge"},
+            "other": {"val": 2.0, "unit": "nanometer"},
+            "positions": {"val": [[0.0, 1.0, 2.0]], "unit": "angstrom"},
+        }
+
+        parsed = model.model_validate_json(m.model_dump_json())
+
+        assert parsed.mass == m.mass
+        assert parsed.other == m.other
+        assert all(parsed.charges == m.charges)
+        assert (parsed.positions == m.positions).all()
+
+    def test_json_from_pydantic_v1(self, model):
+        class V1Molecule(DefaultModel):
+            mass: FloatQuantity["atomic_mass_constant"]
+            charges: ArrayQuantity["elementary_charge"]
+            other: FloatQuantity
+            positions: ArrayQuantity["[length]"]
+
+        v1 = V1Molecule(
+            mass=16.0 * unit.atomic_mass_constant,
+            charges=[-1.0, 0.5, 0.5] * unit.elementary_charge,
+            other=2.0 * unit.nanometer,
+            positions=[[0.0, 1.0, 2.0]] * unit.angstrom,
+        )
+
+        parsed = model.model_validate_json(v1.json())
+
+        assert parsed.mass == v1.mass
+        assert (parsed.positions == v1.positions).all()
+
 
 @skip_if_missing("openmm.unit")
 def test_is_openmm_quantity():
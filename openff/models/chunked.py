@@ -0,0 +1,308 @@
+"""Store unit-bearing arrays larger than memory as directories of chunk files."""
+
+import itertools
+import json
+import lzma
+import math
+import os
+import zlib
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy
+from openff.units import Quantity, Unit
+
+from openff.models.types import _unit_from_string
+
+PathLike = Union[str, os.PathLike]
+
+_MANIFEST = "manifest.json"
+
+_COMPRESSORS = {
+    None: (lambda data: data, lambda data: data),
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def _selection(key, shape: tuple[int, ...]) -> list[Union[int, slice]]:
+    """Expand a basic NumPy index into one integer or slice per dimension."""
+    key = key if isinstance(key, tuple) else (key,)
+    if any(element is Ellipsis for element in key):
+        position = next(i for i, element in enumerate(key) if element is Ellipsis)
+        fill = (slice(None),) * (len(shape) - len(key) + 1)
+        key = key[:position] + fill + key[position + 1 :]
+    if len(key) > len(shape):
+        raise IndexError(
+            f"Too many indices for an array with {len(shape)} dimensions, found {len(key)}"
+        )
+    key = key + (slice(None),) * (len(shape) - len(key))
+
+    selection: list[Union[int, slice]] = list()
+    for element, length in zip(key, shape):
+        if isinstance(element, slice):
+            selection.append(element)
+        elif isinstance(element, (int, numpy.integer)):
+            if not -length <= element < length:
+                raise IndexError(
+                    f"Index {element} is out of bounds for a dimension of size {length}"
+                )
+            selection.append(int(element) % length)
+        else:
+            raise IndexError(
+                f"Chunked arrays only support integers, slices and ..., found {element!r}"
+            )
+    return selection
+
+
+def _chunk_groups(element: Union[int, slice], length: int, chunk: int) -> list:
+    """
+    Split the indices selected along one dimension by the chunks they fall in.
+
+    Returns tuples of a chunk index, the slice of the selection in that chunk and the
+    indices within the chunk.
+    """
+    if isinstance(element, int):
+        indices = numpy.array([element])
+    else:
+        indices = numpy.arange(*element.indices(length))
+    if not len(indices):
+        return []
+
+    # Indices are monotonic, so each chunk is covered by one run of the selection
+    chunk_indices = indices // chunk
+    bounds = [0, *(numpy.flatnonzero(numpy.diff(chunk_indices)) + 1), len(indices)]
+    return [
+        (
+            int(chunk_indices[start]),
+            slice(start, end),
+            indices[start:end] - chunk_indices[start] * chunk,
+        )
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
+class ChunkedArray:
+    """
+    A unit-bearing array stored on disk as a directory of fixed-size chunks.
+
+    The directory holds a JSON manifest with the unit, dtype, shape and chunk shape of the
+    array, and one file per chunk, each optionally compressed with zlib or lzma. Indexing
+    with integers and slices reads only the chunks that are needed and returns a `Quantity`:
+
+    >>> positions = ChunkedArray.create("traj", (0, 1000, 3), "float32", "nanometer", (100, 1000, 3))
+    >>> positions.append(frames)
+    >>> positions[-10:, :5]
+
+    Models can refer to chunked arrays in `ArrayQuantity` fields, in which case they are
+    serialized as a reference to the directory rather than their contents.
+    """
+
+    def __init__(self, path: PathLike):
+        """Open a chunked array written by `ChunkedArray.create`."""
+        self.path = Path(path)
+        manifest = json.loads((self.path / _MANIFEST).read_text())
+        if manifest.get("format") != 1:
+            raise ValueError(f"Unknown chunked array format in {self.path}")
+
+        self.units: Unit = _unit_from_string(manifest["unit"])
+        self.dtype = numpy.dtype(manifest["dtype"])
+        self.shape: tuple[int, ...] = tuple(manifest["shape"])
+        self.chunks: tuple[int, ...] = tuple(manifest["chunks"])
+        self.compression: Optional[str] = manifest["compression"]
+        self._compress, self._decompress = _COMPRESSORS[self.compression]
+
+    @classmethod
+    def create(
+        cls,
+        path: PathLike,
+        shape: tuple[int, ...],
+        dtype,
+        units: Union[str, Unit],
+        chunks: tuple[int, ...],
+        *,
+        compression: Optional[str] = None,
+    ) -> "ChunkedArray":
+        """
+        Create an empty chunked array in a new directory.
+
+        Elements that have not been written read as zero. `compression` can be None, "zlib"
+        or "lzma".
+        """
+        if compression not in _COMPRESSORS:
+            raise ValueError(f"Unknown compression {compression}")
+        if not shape:
+            raise ValueError("Chunked arrays must have at least one dimension")
+        if len(chunks) != len(shape) or any(length < 1 for length in chunks):
+            raise ValueError(
+                f"Chunks {chunks} must be positive and match the dimensions of {shape}"
+            )
+
+        path = Path(path)
+        path.mkdir(parents=True)
+        _write_manifest(
+            path, Unit(str(units)), numpy.dtype(dtype), shape, chunks, compression
+        )
+        return cls(path)
+
+    @classmethod
+    def from_array(
+        cls,
+        path: PathLike,
+        quantity: Quantity,
+        chunks: tuple[int, ...],
+        *,
+        compression: Optional[str] = None,
+    ) -> "ChunkedArray":
+        """Write an array quantity to a new chunked array, in the same unit and dtype."""
+        array = numpy.asarray(quantity.m)
+        chunked = cls.create(
+            path,
+            array.shape,
+            array.dtype,
+            quantity.units,
+            chunks,
+            compression=compression,
+        )
+        chunked[...] = quantity
+        return chunked
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkedArray({str(self.path)!r}, shape={self.shape}, "
+            f"dtype={self.dtype}, units={self.units})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChunkedArray):
+            return NotImplemented
+        return self.path.resolve() == other.path.resolve()
+
+    def __hash__(self) -> int:
+        return hash(self.path.resolve())
+
+    def _chunk_path(self, index: tuple[int, ...]) -> Path:
+        return self.path / ".".join(map(str, index))
+
+    def _read_chunk(self, index: tuple[int, ...]) -> numpy.ndarray:
+        try:
+            data = self._chunk_path(index).read_bytes()
+        except FileNotFoundError:
+            return numpy.zeros(self.chunks, dtype=self.dtype)
+        return numpy.frombuffer(self._decompress(data), dtype=self.dtype).reshape(
+            self.chunks
+        )
+
+    def _write_chunk(self, index: tuple[int, ...], chunk: numpy.ndarray):
+        path = self._chunk_path(index)
+        temporary = path.with_name(path.name + ".tmp")
+        temporary.write_bytes(self._compress(chunk.tobytes()))
+        os.replace(temporary, path)
+
+    def _groups(self, selection: list) -> list[list]:
+        return [
+            _chunk_groups(element, length, chunk)
+            for element, length, chunk in zip(selection, self.shape, self.chunks)
+        ]
+
+    def __getitem__(self, key) -> Quantity:
+        """Read the selected elements, from only the chunks that contain them."""
+        selection = _selection(key, self.shape)
+        groups = self._groups(selection)
+        out = numpy.zeros(
+            [sum(len(local) for *_, local in dimension) for dimension in groups],
+            dtype=self.dtype,
+        )
+
+        for combination in itertools.product(*groups):
+            index, positions, locals_ = zip(*combination)
+            chunk = self._read_chunk(index)
+            out[positions] = chunk[numpy.ix_(*locals_)]
+
+        # Integer indices drop their dimension, as in NumPy
+        shape = [
+            length
+            for element, length in zip(selection, out.shape)
+            if isinstance(element, slice)
+        ]
+        return Quantity(out.reshape(shape), self.units)
+
+    def __setitem__(self, key, value: Quantity):
+        """Write a quantity, converted to the unit of this array, to the selected elements."""
+        if not isinstance(value, Quantity):
+            raise ValueError(f"Values written to {self!r} must be quantities")
+
+        selection = _selection(key, self.shape)
+        groups = self._groups(selection)
+        shape = [sum(len(local) for *_, local in dimension) for dimension in groups]
+        kept = [
+            length
+            for element, length in zip(selection, shape)
+            if isinstance(element, slice)
+        ]
+        array = numpy.asarray(value.m_as(self.units), dtype=self.dtype)
+        array = numpy.broadcast_to(array, kept).reshape(shape)
+
+        for combination in itertools.product(*groups):
+            index, positions, locals_ = zip(*combination)
+            chunk = self._read_chunk(index).copy()
+            chunk[numpy.ix_(*locals_)] = array[positions]
+            self._write_chunk(index, chunk)
+
+    def append(self, value: Quantity):
+        """Append a quantity along the first axis, e.g. frames to a trajectory."""
+        if not isinstance(value, Quantity):
+            raise ValueError(f"Values appended to {self!r} must be quantities")
+        if numpy.shape(value.m)[1:] != self.shape[1:]:
+            raise ValueError(
+                f"Cannot append an array of shape {numpy.shape(value.m)} to {self!r}"
+            )
+
+        start = self.shape[0]
+        self.shape = (start + numpy.shape(value.m)[0], *self.shape[1:])
+        self[start:] = value
+        # The manifest is only updated once the chunks are written, so readers never see
+        # rows without data
+        _write_manifest(
+            self.path,
+            self.units,
+            self.dtype,
+            self.shape,
+            self.chunks,
+            self.compression,
+        )
+
+
+def _write_manifest(path: Path, units: Unit, dtype, shape, chunks, compression):
+    manifest = {
+        "format": 1,
+        "unit": str(units),
+        "dtype": dtype.str,
+        "shape": list(shape),
+        "chunks": list(chunks),
+        "compression": compression,
+    }
+    temporary = path / (_MANIFEST + ".tmp")
+    temporary.write_text(json.dumps(manifest))
+    os.replace(temporary, path / _MANIFEST)
+
+
+def _encode_reference(array: ChunkedArray) -> str:
+    """
+    Encode a chunked array in a model as a reference to its directory.
+
+    The path is made absolute, so that the reference does not depend on the working directory
+    when it is loaded.
+    """
+    return json.dumps({"path": str(array.path.resolve()), "unit": str(array.units)})
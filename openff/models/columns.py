@@ -0,0 +1,313 @@
+"""Operate on one field of many models at once, as a single array."""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional, Union, cast
+
+import numpy
+from openff.units import Quantity, Unit
+from openff.units import unit as unit_registry
+
+from openff.models._compiled import _plain_types
+from openff.models.exceptions import UnitValidationError
+from openff.models.models import DefaultModel
+from openff.models.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    StrictArrayQuantity,
+    _declared_unit,
+    _magnitude_of,
+    _new_float_quantity,
+    _units_of,
+    quantity_pool,
+)
+
+
+def _field(models: Sequence[DefaultModel], name: str):
+    cls = models[0].__class__
+    if any(model.__class__ is not cls for model in models):
+        raise ValueError("All models must be of the same class")
+    if name not in cls.__fields__:
+        raise ValueError(f"{cls.__name__} has no field {name}")
+    return cls.__fields__[name]
+
+
+def column(
+    models: Sequence[DefaultModel],
+    name: str,
+    unit: Optional[Union[str, Unit]] = None,
+) -> Union[Quantity, numpy.ndarray]:
+    """
+    Gather the values of one field of many models into a single array.
+
+    Quantities are converted to `unit`, or the unit of the first value, with one conversion
+    for each distinct unit found, and returned as one quantity. Array quantities must all have
+    the same shape, and are stacked along a new first axis. Values of other fields are
+    returned as a plain NumPy array.
+    """
+    if not models:
+        if unit is None:
+            raise ValueError("The unit of an empty column must be given")
+        return Quantity(numpy.empty(0), unit)
+
+    _field(models, name)
+    try:
+        values = [model.__dict__[name] for model in models]
+    except KeyError:
+        raise ValueError(f"Not all of the models have a value for field {name}")
+    first = values[0]
+    if not isinstance(first, Quantity):
+        return numpy.asarray(values)
+
+    for val in values:
+        if not isinstance(val, Quantity):
+            raise ValueError(f"Cannot gather {val!r} into a column of quantities")
+    magnitudes = [_magnitude_of(val) for val in values]
+
+    if isinstance(_magnitude_of(first), numpy.ndarray):
+        try:
+            array = numpy.stack(magnitudes)
+        except ValueError:
+            raise ValueError(f"The arrays of field {name} have different shapes")
+    else:
+        array = numpy.asarray(magnitudes, dtype=float)
+
+    first_units = _units_of(first)
+    target = first_units if unit is None else _units_of(unit_registry.Unit(unit))
+    units = [_units_of(val) for val in values]
+    if all(units_ is first_units or units_ == first_units for units_ in units):
+        if first_units != target:
+            array = unit_registry.convert(
+                array.astype(float, copy=False), first_units, target
+            )
+        return Quantity(array, target)
+
+    # Convert each group of values sharing a unit at once
+    array = array.astype(float, copy=False)
+    for units_ in set(units):
+        if units_ != target:
+            mask = numpy.fromiter((u == units_ for u in units), bool, len(units))
+            array[mask] = unit_registry.convert(array[mask], units_, target)
+
+    return Quantity(array, target)
+
+
+def _quantity_type(cls, field, name: str) -> type:
+    type_ = field.type_
+    if not isinstance(type_, type) or not issubclass(
+        type_, (FloatQuantity, ArrayQuantity)
+    ):
+        raise ValueError(f"Field {name} of {cls.__name__} is not a quantity")
+    return type_
+
+
+def _has_validators(cls, field) -> bool:
+    return any(
+        [
+            field.class_validators,
+            cls.__pre_root_validators__,
+            cls.__post_root_validators__,
+        ]
+    )
+
+
+def _split_column(cls, field, name: str, values: Quantity) -> list:
+    """
+    Validate a column of values of a quantity field at once, and split it into one value per
+    model, in the declared unit of the field.
+    """
+    type_ = field.type_
+    validator: Any = StrictArrayQuantity if type_.__strict__ else ArrayQuantity
+    if getattr(type_, "__unit__", None) is not None:
+        validator = validator[type_.__unit__]
+    try:
+        validated = validator.validate_type(values)
+    except AssertionError:
+        raise UnitValidationError(
+            f"Cannot use a column in units of {values.units} for field {name}, "
+            f"in units of {type_.__unit__}"
+        )
+    units = validated._units
+
+    if issubclass(type_, FloatQuantity):
+        if numpy.ndim(validated.m) != 1:
+            raise ValueError(f"Field {name} needs a one-dimensional column")
+        column_ = [
+            _new_float_quantity(magnitude, units)
+            for magnitude in numpy.asarray(validated.m, dtype=float).tolist()
+        ]
+        if cls.__config__.intern_quantities:
+            column_ = [quantity_pool.intern(value) for value in column_]
+        return column_
+
+    array = numpy.array(validated.m)
+    return [Quantity(row, units) for row in array]
+
+
+def assign_column(models: Sequence[DefaultModel], name: str, values: Quantity):
+    """
+    Set one field of many models from the rows of a single quantity.
+
+    The whole column is validated against the field at once, as `ArrayQuantity` would
+    validate it, so each model receives a value already in the declared unit of the field.
+    Array fields receive views of one copy of the column. Fields with their own validators
+    or checks on assignment, such as `Field(allow_mutation=False)` or `Field(const=True)`,
+    and models with root validators, are assigned one model at a time instead.
+    """
+    if not models:
+        return
+
+    field = _field(models, name)
+    cls = models[0].__class__
+    if not cls.__config__.allow_mutation or cls.__config__.frozen:
+        raise TypeError(
+            f'"{cls.__name__}" is immutable and does not support item assignment'
+        )
+    # The rows of the column, if it is a quantity of an array
+    rows = cast(Sequence[Quantity], values)
+    if len(rows) != len(models):
+        raise ValueError(
+            f"Cannot assign a column of {len(rows)} values to {len(models)} models"
+        )
+    _quantity_type(cls, field, name)
+
+    checked = any(
+        [
+            _has_validators(cls, field),
+            field.field_info.const,
+            not field.field_info.allow_mutation,
+            field.final,
+        ]
+    )
+    if checked:
+        # Left to pydantic, which e.g. rejects assignments to `Field(allow_mutation=False)`
+        for model, value in zip(models, rows):
+            setattr(model, name, value)
+        return
+
+    for model, value in zip(models, _split_column(cls, field, name, values)):
+        model.__dict__[name] = value
+        model.__fields_set__.add(name)
+
+
+# The kinds of NumPy array that hold values of each plain field type as they are
+_KINDS = {bool: "b", int: "iu", float: "f", str: "U"}
+
+
+def _is_plain(field) -> bool:
+    return field.type_ in _KINDS and field.outer_type_ is field.type_
+
+
+def to_records(
+    models: Sequence[DefaultModel], fields: Optional[Iterable[str]] = None
+) -> tuple[numpy.ndarray, dict[str, str]]:
+    """
+    Gather the fields of many models into a NumPy structured array, one record per model.
+
+    Float quantity and plain scalar fields become fields of the record, and array quantity
+    fields of the same shape in every model become subarray fields. Quantities are stored in
+    the declared unit of their field, or the unit of the first value, and these units are
+    returned alongside the records, mapping each field name to the string of its unit. Only
+    the named `fields` are gathered, if given.
+    """
+    if not models:
+        raise ValueError("Cannot make records of no models, whose fields have no shape")
+
+    cls = models[0].__class__
+    names = list(cls.__fields__ if fields is None else fields)
+    columns: dict[str, numpy.ndarray] = dict()
+    units = dict()
+    for name in names:
+        field = _field(models, name)
+        if _is_plain(field):
+            values = numpy.asarray(column(models, name))
+            if values.dtype.kind not in _KINDS[field.type_]:
+                raise ValueError(
+                    f"Field {name} of {cls.__name__} has values other than {field.type_.__name__}"
+                )
+        else:
+            type_ = _quantity_type(cls, field, name)
+            quantity = cast(Quantity, column(models, name, _declared_unit(type_)))
+            units[name] = str(quantity.units)
+            values = numpy.asarray(quantity.m)
+        columns[name] = values
+
+    records = numpy.empty(
+        len(models),
+        dtype=[
+            (name, values.dtype, values.shape[1:]) for name, values in columns.items()
+        ],
+    )
+    for name, values in columns.items():
+        records[name] = values
+    return records, units
+
+
+def from_records(
+    cls: type[DefaultModel],
+    records: numpy.ndarray,
+    units: Optional[dict[str, Union[str, Unit]]] = None,
+) -> list[DefaultModel]:
+    """
+    Make one model from each record of a NumPy structured array written by `to_records`.
+
+    Each quantity field is tagged with its unit in `units`, or the declared unit of the field,
+    and validated once for the whole column, as by `assign_column`. Models whose fields have
+    their own validators or are constant, or which have root validators, are validated one at
+    a time.
+    """
+    units = dict() if units is None else units
+    names = records.dtype.names or ()
+    for name in names:
+        if name not in cls.__fields__:
+            raise ValueError(f"{cls.__name__} has no field {name}")
+    fields = {name: cls.__fields__[name] for name in names}
+
+    # Whether the columns can be validated at once, without pydantic validating each model
+    plain_types = _plain_types(cls.__config__)
+    plain = [name for name, field in fields.items() if _is_plain(field)]
+    validated = all(
+        [
+            not cls.__pre_root_validators__,
+            not cls.__post_root_validators__,
+            not any(field.class_validators for field in fields.values()),
+            # e.g. the check of `Field(const=True)`, which `construct` would skip
+            not any(
+                field.field_info.const or field.pre_validators or field.post_validators
+                for field in fields.values()
+            ),
+            all(
+                name in names
+                for name, field in cls.__fields__.items()
+                if field.required
+            ),
+            all(fields[name].type_ in plain_types for name in plain),
+            all(
+                records.dtype[name].kind in _KINDS[fields[name].type_] for name in plain
+            ),
+        ]
+    )
+
+    columns = dict()
+    for name, field in fields.items():
+        array = records[name]
+        if _is_plain(field):
+            columns[name] = array.tolist()
+            continue
+
+        type_ = _quantity_type(cls, field, name)
+        unit_ = units.get(name, getattr(type_, "_unit", None))
+        if unit_ is None:
+            raise ValueError(f"The unit of field {name} must be given")
+        if validated:
+            columns[name] = _split_column(cls, field, name, Quantity(array, unit_))
+        elif array.ndim == 1:
+            columns[name] = [Quantity(val, unit_) for val in array.tolist()]
+        else:
+            columns[name] = [Quantity(row, unit_) for row in array]
+
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    if not columns:
+        rows = [dict() for _ in range(len(records))]
+    if not validated:
+        return [cls(**row) for row in rows]
+    return [cls.construct(set(names), **row) for row in rows]
@@ -1,9 +1,110 @@
-from typing import Any, Callable
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator
+from concurrent.futures import Executor
+from copy import deepcopy
+from typing import IO, Any, Callable, Optional, TextIO
 
+import numpy
 from openff.units import Quantity
 
-from openff.models._pydantic import BaseModel
-from openff.models.types import custom_quantity_encoder, json_loader
+from openff.models import _aio, _binary, _compiled, _json
+from openff.models._pydantic import BaseModel, PrivateAttr, ValidationError
+from openff.models.chunked import ChunkedArray, _encode_reference
+from openff.models.types import (
+    _dimensionality_of,
+    _LazyQuantity,
+    _to_omm_quantity,
+    _units_of,
+    custom_quantity_encoder,
+    json_loader,
+    quantity_pool,
+)
+
+
+def _has_writeable_base(array: numpy.ndarray) -> bool:
+    """Return whether the data of an array can be written through an object it is a view of."""
+    base = array.base
+    while isinstance(base, numpy.ndarray):
+        if base.flags.writeable:
+            return True
+        base = base.base
+    if base is None:
+        return False
+    # A buffer exported by another object, e.g. a bytearray or ctypes array
+    try:
+        return not memoryview(base).readonly
+    except TypeError:
+        return True
+
+
+def _hash_value(val) -> int:
+    """Hash a field value by its contents, including unit-bearing arrays."""
+    if isinstance(val, Quantity):
+        if isinstance(val.m, numpy.ndarray):
+            digest = hashlib.blake2b(numpy.ascontiguousarray(val.m).data).digest()
+            return hash((val.m.dtype.str, val.m.shape, digest, _units_of(val)))
+        return hash((_hash_value(val.m), _units_of(val)))
+    if isinstance(val, float) and val != val:
+        # NaN hashes by identity, but all NaNs are identical here
+        return hash("nan")
+    if isinstance(val, (list, tuple)):
+        return hash(tuple(_hash_value(element) for element in val))
+    if isinstance(val, dict):
+        return hash(frozenset((key, _hash_value(value)) for key, value in val.items()))
+    return hash(val)
+
+
+def _values_identical(a, b) -> bool:
+    """Compare field values exactly, as they are hashed by `_hash_value`, with NaN equal to NaN."""
+    if a is b:
+        # e.g. values shared through `quantity_pool` or by copies
+        return True
+    if isinstance(a, Quantity) and isinstance(b, Quantity):
+        return _units_of(a) == _units_of(b) and numpy.array_equal(
+            a.m, b.m, equal_nan=True
+        )
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (a != a and b != b)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(map(_values_identical, a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_values_identical(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _values_close(a, b, rtol: float, atol: float) -> bool:
+    """Compare field values after converting quantities to common units, with NaN equal to NaN."""
+    if a is b:
+        # e.g. values shared through `quantity_pool` or by copies
+        return True
+    if isinstance(a, Quantity) or isinstance(b, Quantity):
+        if not (isinstance(a, Quantity) and isinstance(b, Quantity)):
+            return False
+        if _units_of(a) == _units_of(b):
+            a, b = a.m, b.m
+        elif _dimensionality_of(a) == _dimensionality_of(b):
+            a, b = a.m, b.m_as(a.units)
+        else:
+            return False
+    elif isinstance(a, DefaultModel) and isinstance(b, DefaultModel):
+        return a.equals(b, rtol=rtol, atol=atol)
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(
+            _values_close(x, y, rtol, atol) for x, y in zip(a, b)
+        )
+    elif isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(
+            _values_close(a[k], b[k], rtol, atol) for k in a
+        )
+    elif not isinstance(a, (float, numpy.ndarray)) or isinstance(a, bool):
+        return a == b
+
+    if numpy.shape(a) != numpy.shape(b):
+        return False
+    if rtol == 0.0 and atol == 0.0:
+        return bool(numpy.array_equal(a, b, equal_nan=True))
+    return bool(numpy.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True))
 
 
 class DefaultModel(BaseModel):
@@ -14,7 +115,412 @@ class DefaultModel(BaseModel):
 
         json_encoders: dict[Any, Callable] = {
             Quantity: custom_quantity_encoder,
+            ChunkedArray: _encode_reference,
         }
         json_loads: Callable = json_loader
         validate_assignment: bool = True
         arbitrary_types_allowed: bool = True
+        # If True, copies share read-only array buffers, see `DefaultModel.make_writeable`.
+        # The first copy duplicates any writeable buffers, which may belong to the caller
+        copy_on_write: bool = False
+        # If True, equal FloatQuantity values share one object, which must then not be
+        # changed in place (e.g. with `Quantity.ito`), see `types.QuantityPool`
+        intern_quantities: bool = False
+
+    def __init__(__pydantic_self__, **data):
+        # Uses something other than `self` as the first argument, as pydantic does, to allow
+        # "self" as a field name
+        validators = _compiled.validators(__pydantic_self__.__class__)
+        result = validators.validate_init(data) if validators is not None else None
+        if result is None:
+            # Let pydantic validate everything again, and raise any errors
+            super().__init__(**data)
+            __pydantic_self__._intern_quantities()
+            return
+
+        values, fields_set = result
+        object.__setattr__(__pydantic_self__, "__dict__", values)
+        object.__setattr__(__pydantic_self__, "__fields_set__", fields_set)
+        __pydantic_self__._init_private_attributes()
+
+    def __setattr__(self, name, value):
+        validators = _compiled.validators(self.__class__)
+        if validators is not None and name in validators.assign:
+            validated = validators.assign[name](value)
+            if validated is not _compiled._missing:
+                if name in validators.interned:
+                    validated = quantity_pool.intern(validated)
+                self.__dict__[name] = validated
+                self.__fields_set__.add(name)
+                return
+        super().__setattr__(name, value)
+        # Root validators may have changed any field
+        self._intern_quantities()
+
+    def _intern_quantities(self):
+        """Share the values of FloatQuantity fields through `quantity_pool`, if configured."""
+        for name in _compiled.interned(self.__class__):
+            if name in self.__dict__:
+                self.__dict__[name] = quantity_pool.intern(self.__dict__[name])
+
+    def json(self, **kwargs) -> str:
+        """
+        Generate a JSON representation of the model, as `pydantic.BaseModel.json`.
+
+        Without arguments, the document is written by a serializer built once for the class,
+        which encodes quantities directly rather than going through pydantic's `dict()` and
+        `custom_quantity_encoder`.
+        """
+        if not kwargs:
+            serializer = _json.serializer(self.__class__)
+            if serializer is not None:
+                return serializer(self)
+        return super().json(**kwargs)
+
+    def dump_json(self, fp: TextIO, *, chunk_size: int = 65536):
+        """
+        Write the same document as `DefaultModel.json` to a text file object, incrementally.
+
+        Array quantities are written in blocks of about `chunk_size` elements straight from
+        their buffers, so the memory used does not grow with the size of the arrays.
+        """
+        _json.dump_json(self, fp, chunk_size)
+
+    @classmethod
+    def load_json(cls, fp: IO, *, chunk_size: int = 1048576):
+        """
+        Load a model from the output of `DefaultModel.json` in a text or binary file object.
+
+        The file is read `chunk_size` characters at a time and array quantities are decoded
+        straight into NumPy buffers, without building lists of Python floats.
+        """
+        return cls.parse_obj(_json.load_json(fp, chunk_size))
+
+    @classmethod
+    def write_jsonl(cls, models: Iterable["DefaultModel"], fp: TextIO):
+        """
+        Write models to a text file object in the JSON Lines format, one model per line.
+
+        `models` can be any iterable, including a generator, and is consumed one model at a
+        time.
+        """
+        _json.write_jsonl(models, fp)
+
+    @classmethod
+    def iter_jsonl(cls, fp: IO, *, validate: bool = True) -> Iterator["DefaultModel"]:
+        """
+        Lazily load models of this class from a JSON Lines file object, one per line.
+
+        If `validate` is False, models are built with `construct`, skipping validation; this
+        is only safe for trusted data, such as that written by `DefaultModel.write_jsonl`.
+        """
+        return _json.iter_jsonl(cls, fp, validate)
+
+    @classmethod
+    def dump_collection(cls, models: Iterable["DefaultModel"], fp: TextIO):
+        """
+        Write many models to a text file object as one JSON document with a shared unit table.
+
+        Each distinct unit is written once, in a table at the top of the document, and each
+        quantity refers to its unit by its index in that table. This keeps files of many small
+        models compact and means that each unit is only parsed once when loading them.
+        """
+        _json.dump_collection(models, fp)
+
+    @classmethod
+    def load_collection(cls, fp: IO) -> list["DefaultModel"]:
+        """Load models of this class from a file written by `DefaultModel.dump_collection`."""
+        return _json.load_collection(cls, fp)
+
+    def save(self, path):
+        """
+        Write this model to a binary file which `DefaultModel.load` can read fields from alone.
+
+        The file starts with an index of the offset and length of each field's payload.
+        Array quantities are stored as raw buffers and other values as JSON.
+        """
+        _binary.save(self, path)
+
+    @classmethod
+    def load(cls, path, *, fields: Optional[Iterable[str]] = None, lazy: bool = False):
+        """
+        Load a model from a file written by `DefaultModel.save`.
+
+        If `fields` is given, only those fields are read and validated; the payloads of the
+        others are skipped without being read. The result is then a partial model built with
+        `construct`, in which unrequested fields take their defaults, if any, or are missing.
+
+        If `lazy` is True, array quantities keep their raw payloads and are only decoded,
+        and converted to the units of their fields, the first time their magnitudes are used.
+        """
+        values = _binary.load(cls, path, fields, lazy)
+        if fields is None:
+            return cls.parse_obj(values)
+
+        errors = list()
+        for name, value in values.items():
+            values[name], error = cls.__fields__[name].validate(
+                value, values, loc=name, cls=cls
+            )
+            if error:
+                errors.append(error)
+        if errors:
+            raise ValidationError(errors, cls)
+        return cls.construct(_fields_set=set(values), **values)
+
+    @classmethod
+    async def aload(
+        cls,
+        path,
+        *,
+        executor: Optional[Executor] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ):
+        """
+        Load a model from a file written by `DefaultModel.json` without blocking the event loop.
+
+        Reading and decoding run in `executor`, or the event loop's default executor. At most
+        `limit` loads and saves run at once; by default, a semaphore shared by each event loop
+        allows 16.
+        """
+        return await _aio.load(cls, path, executor, limit)
+
+    async def asave(
+        self,
+        path,
+        *,
+        executor: Optional[Executor] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ):
+        """Write this model to a file without blocking the event loop, see `DefaultModel.aload`."""
+        await _aio.save(self, path, executor, limit)
+
+    @classmethod
+    def aiter_jsonl(
+        cls,
+        path,
+        *,
+        executor: Optional[Executor] = None,
+        batch_size: int = 256,
+    ) -> AsyncIterator["DefaultModel"]:
+        """
+        Asynchronously iterate over the models in a JSON Lines file, see `DefaultModel.iter_jsonl`.
+
+        Lines are parsed in batches of `batch_size` in `executor`, or the event loop's default
+        executor, with only the next batch read ahead.
+        """
+        return _aio.iter_jsonl(cls, path, executor, batch_size)
+
+    def equals(self, other, *, rtol: float = 0.0, atol: float = 0.0) -> bool:
+        """
+        Compare this model to another of the same class, field by field.
+
+        Quantities are compared after converting to the units of this model's values,
+        with the magnitudes compared by `numpy.array_equal`, or by `numpy.allclose` with
+        the given tolerances if either is non-zero; NaN is equal to NaN. A field missing
+        from only one of the models, e.g. a partial model from `DefaultModel.load`, differs.
+        Comparison stops at the first field that differs.
+        """
+        if other.__class__ is not self.__class__:
+            return False
+        if self.__dict__.keys() != other.__dict__.keys():
+            return False
+        return all(
+            _values_close(value, other.__dict__[name], rtol, atol)
+            for name, value in self.__dict__.items()
+        )
+
+    def diff(
+        self, other, *, rtol: float = 0.0, atol: float = 0.0
+    ) -> dict[str, tuple[Any, Any]]:
+        """
+        Return the fields whose values differ from those of another model of the same class.
+
+        Values are compared as by `DefaultModel.equals`. The returned dict maps the name of
+        each differing field to a tuple of this model's value and the other model's value,
+        with `None` in place of the value of a field missing from a partial model.
+        """
+        if other.__class__ is not self.__class__:
+            raise TypeError(
+                f"Cannot diff {self.__class__.__name__} against {other.__class__.__name__}"
+            )
+        differences = dict()
+        for name in dict.fromkeys([*self.__dict__, *other.__dict__]):
+            if name in self.__dict__ and name in other.__dict__:
+                value, other_value = self.__dict__[name], other.__dict__[name]
+                if _values_close(value, other_value, rtol, atol):
+                    continue
+            differences[name] = (self.__dict__.get(name), other.__dict__.get(name))
+        return differences
+
+    def to_openmm(self, *names: str) -> dict[str, Any]:
+        """
+        Convert the named quantity fields, or all fields holding quantities, to OpenMM quantities.
+
+        Arrays are wrapped without being copied or turned into lists of `Vec3`, so e.g. (N, 3)
+        positions can be passed straight to `Context.setPositions`. Units are converted to
+        OpenMM units through a mapping built once per unit.
+        """
+        if not names:
+            names = tuple(
+                name
+                for name, value in self.__dict__.items()
+                if isinstance(value, Quantity)
+            )
+        converted = dict()
+        for name in names:
+            if name not in self.__fields__:
+                raise ValueError(f"{self.__class__.__name__} has no field {name}")
+            value = self.__dict__.get(name)
+            if not isinstance(value, Quantity):
+                raise ValueError(
+                    f"Field {name} does not hold a quantity, found {value!r}"
+                )
+            converted[name] = _to_omm_quantity(value)
+        return converted
+
+    def __deepcopy__(self, memo):
+        if self.__config__.copy_on_write:
+            shared = self._share_arrays(self._field_ids())
+            # Seeding the memo makes deepcopy return the shared quantities as-is
+            memo.update({id(val): val for val in shared.values()})
+        # As deepcopy would copy any other object, keeping references shared through memo
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        copied.__setstate__(deepcopy(self.__getstate__(), memo))
+        return copied
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        if self.__config__.copy_on_write:
+            shared = self._share_arrays(self._field_ids())
+            values = {
+                name: shared.get(id(value), value) for name, value in values.items()
+            }
+            if deep:
+                # Seeding the memo makes deepcopy return the shared quantities as-is
+                values = deepcopy(values, {id(val): val for val in shared.values()})
+                deep = False
+
+        return super()._copy_and_set_values(values, fields_set, deep=deep)
+
+    def _field_ids(self) -> set[int]:
+        """
+        Return the `id` of each field value, to be treated as inputs by `_share_arrays`.
+
+        Validation stores arrays already in the right unit without copying them, so a
+        writeable buffer may still be owned by the caller and must not be frozen in place.
+        """
+        return {id(value) for value in self.__dict__.values()}
+
+    def _share_arrays(self, inputs: Collection[int] = ()) -> dict[int, Quantity]:
+        """
+        Make the array buffers of this model read-only so that they can be shared with copies.
+
+        Buffers which could still be written through another reference are copied first:
+        those that are views of writeable data, and writeable arrays of the quantities whose
+        `id` is in `inputs`, e.g. arguments stored without a copy. Returns a mapping from the
+        `id` of each array quantity, before and after this call, to the read-only quantity
+        now stored in this model.
+        """
+        shared: dict[int, Quantity] = dict()
+        for name, value in self.__dict__.items():
+            if isinstance(value, _LazyQuantity) and not value.is_decoded:
+                value._read_only()
+                shared[id(value)] = value
+                continue
+            if isinstance(value, Quantity) and isinstance(value.m, numpy.ndarray):
+                array = value.m
+                if _has_writeable_base(array) or all(
+                    [array.flags.writeable, id(value) in inputs]
+                ):
+                    array = array.copy()
+                    shared[id(value)] = self.__dict__[name] = value.__class__(
+                        array, _units_of(value)
+                    )
+                array.flags.writeable = False
+                shared[id(self.__dict__[name])] = self.__dict__[name]
+
+        return shared
+
+    def make_writeable(self, *names: str):
+        """
+        Give array fields private, writeable buffers ahead of writing to them in place.
+
+        With `Config.copy_on_write`, copies of a model share read-only array buffers with
+        the original. Reassigning a field never affects other copies, but in-place writes
+        (e.g. `model.positions[0] = ...`) need the buffer to be duplicated first; only the
+        named fields (or all shared array fields, if none are named) are duplicated.
+        """
+        if not self.__config__.allow_mutation or self.__config__.frozen:
+            raise TypeError(
+                f'"{self.__class__.__name__}" is immutable and does not support '
+                "writing to its arrays"
+            )
+
+        for name in names or self.__fields__.keys():
+            value = self.__dict__.get(name)
+            if isinstance(value, Quantity) and isinstance(value.m, numpy.ndarray):
+                if not value.m.flags.writeable:
+                    self.__dict__[name] = value.__class__(
+                        value.m.copy(), _units_of(value)
+                    )
+
+
+class FrozenDefaultModel(DefaultModel):
+    """
+    An immutable DefaultModel, which can be used as a dict key or in a set.
+
+    Array buffers are stored as read-only views, so copies can always share them. The hash
+    is computed from the contents of the model once and cached; equality is checked against
+    the hashes before comparing any arrays. Quantities are compared exactly as stored, so
+    `1 nanometer` and `10 angstrom` are not equal here even though pint considers them equal.
+    """
+
+    _hash: Optional[int] = PrivateAttr(default=None)
+
+    class Config:
+        """Custom Pydantic configuration."""
+
+        frozen: bool = True
+        copy_on_write: bool = True
+
+    def __init__(__pydantic_self__, **data):
+        super().__init__(**data)
+        __pydantic_self__._share_arrays({id(value) for value in data.values()})
+
+    @classmethod
+    def construct(cls, _fields_set=None, **values):
+        model = super().construct(_fields_set, **values)
+        model._share_arrays({id(value) for value in values.values()})
+        return model
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(
+                (self.__class__, *(_hash_value(val) for val in self.__dict__.values()))
+            )
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        return all(
+            _values_identical(val, other.__dict__[name])
+            for name, val in self.__dict__.items()
+        )
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Hashes of str etc. are only stable within one interpreter
+        self._hash = None
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        copied = super()._copy_and_set_values(values, fields_set, deep=deep)
+        # `copy(update=...)` may have changed values without validating them
+        copied._share_arrays({id(value) for value in values.values()})
+        copied._hash = None
+        return copied
@@ -0,0 +1,248 @@
+"""Serialize and parse collections of models concurrently, with threads or processes."""
+
+import collections
+import itertools
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+from typing import Any, NamedTuple, Optional, TypeVar, Union
+
+from openff.units import Quantity
+
+from openff.models.models import DefaultModel
+from openff.models.types import _unit_from_string
+
+M = TypeVar("M", bound=DefaultModel)
+
+PathLike = Union[str, os.PathLike]
+
+
+class _PackedQuantity(NamedTuple):
+    """A quantity split into its magnitude and unit string, which pickle cheaply."""
+
+    magnitude: Any
+    unit: str
+
+
+def _pack(model: M) -> tuple[type[M], dict, set]:
+    """Reduce a validated model to plain data to send between processes."""
+    values = {
+        name: (
+            _PackedQuantity(val.m, str(val.units)) if isinstance(val, Quantity) else val
+        )
+        for name, val in model.__dict__.items()
+    }
+    return model.__class__, values, model.__fields_set__
+
+
+def _unpack(packed: tuple[type[M], dict, set]) -> M:
+    """Rebuild a model packed by `_pack` in another process, without validating it again."""
+    cls, values, fields_set = packed
+    for name, val in values.items():
+        if isinstance(val, _PackedQuantity):
+            values[name] = Quantity(val.magnitude, _unit_from_string(val.unit))
+    return cls.construct(_fields_set=fields_set, **values)
+
+
+def _dump_chunk(models: list, packed: bool) -> list[str]:
+    return [model.json() for model in (map(_unpack, models) if packed else models)]
+
+
+def _dump_files_chunk(models: list, paths: list, packed: bool) -> list[None]:
+    for model, path in zip(map(_unpack, models) if packed else models, paths):
+        Path(path).write_text(model.json())
+    return [None] * len(paths)
+
+
+def _parse_chunk(cls: type[DefaultModel], documents: list, packed: bool) -> list:
+    models = [cls.parse_raw(document) for document in documents]
+    return [_pack(model) for model in models] if packed else models
+
+
+def _load_chunk(cls: type[DefaultModel], paths: list, packed: bool) -> list:
+    return _parse_chunk(cls, [Path(path).read_bytes() for path in paths], packed)
+
+
+def _max_workers(executor: Executor) -> int:
+    # Both executors of concurrent.futures record their number of workers here
+    return getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+
+
+def _run(
+    function: Callable[..., list],
+    chunks: Iterable[tuple],
+    executor: Optional[Executor],
+    ordered: bool,
+) -> Iterator:
+    """
+    Run `function` on each chunk of arguments and yield the items of the results.
+
+    Only a few chunks per worker are submitted at a time, and more as results are yielded, so
+    that memory use depends on the chunk size rather than the size of the whole collection.
+    """
+    own_executor = executor is None
+    if executor is None:
+        executor = ProcessPoolExecutor()
+
+    chunks = iter(chunks)
+    limit = 2 * _max_workers(executor)
+
+    def submit(count: int) -> list[Future]:
+        return [
+            executor.submit(function, *chunk)
+            for chunk in itertools.islice(chunks, count)
+        ]
+
+    try:
+        if ordered:
+            queue = collections.deque(submit(limit))
+            while queue:
+                results = queue.popleft().result()
+                queue.extend(submit(1))
+                yield from results
+        else:
+            pending = set(submit(limit))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                pending.update(submit(len(done)))
+                for future in done:
+                    yield from future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+
+
+def _chunked(items: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _is_process_pool(executor: Optional[Executor]) -> bool:
+    return executor is None or isinstance(executor, ProcessPoolExecutor)
+
+
+def dump_models(
+    models: Iterable[DefaultModel],
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> Iterator[str]:
+    """
+    Serialize models to JSON, as by `DefaultModel.json`, concurrently.
+
+    Parameters
+    ----------
+    models
+        The models to serialize.
+    executor
+        The executor to run on. By default, a `ProcessPoolExecutor` is created for the call.
+        Models sent to other processes are packed into plain data first.
+    chunk_size
+        The number of models serialized by each task.
+    ordered
+        If True, the documents are yielded in the order of the models; otherwise, they are
+        yielded as soon as they are ready.
+    """
+    pack = _is_process_pool(executor)
+    chunks = (
+        ([_pack(model) for model in chunk] if pack else chunk, pack)
+        for chunk in _chunked(models, chunk_size)
+    )
+    return _run(_dump_chunk, chunks, executor, ordered)
+
+
+def parse_models(
+    cls: type[M],
+    documents: Iterable[Union[str, bytes]],
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> Iterator[M]:
+    """
+    Parse JSON documents into models of one class, as by `DefaultModel.parse_raw`, concurrently.
+
+    Models parsed in other processes are sent back as plain data and rebuilt without being
+    validated again. See `dump_models` for the other parameters.
+    """
+    pack = _is_process_pool(executor)
+    chunks = ((cls, chunk, pack) for chunk in _chunked(documents, chunk_size))
+    results = _run(_parse_chunk, chunks, executor, ordered)
+    return map(_unpack, results) if pack else results
+
+
+def dump_files(
+    models: Iterable[DefaultModel],
+    paths: Iterable[PathLike],
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+):
+    """
+    Write each model, as by `DefaultModel.json`, to the matching path, concurrently.
+
+    See `dump_models` for the other parameters.
+    """
+    pack = _is_process_pool(executor)
+    chunks = (
+        (
+            [_pack(model) if pack else model for model, _ in chunk],
+            [path for _, path in chunk],
+            pack,
+        )
+        for chunk in _chunked(zip(models, paths), chunk_size)
+    )
+    for _ in _run(_dump_files_chunk, chunks, executor, ordered=False):
+        pass
+
+
+def load_files(
+    cls: type[M],
+    paths: Iterable[PathLike],
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> Iterator[M]:
+    """
+    Load models of one class from JSON files, as by `DefaultModel.parse_file`, concurrently.
+
+    Files are read by the workers, so only paths are sent to them. See `parse_models` for the
+    other parameters.
+    """
+    pack = _is_process_pool(executor)
+    chunks = ((cls, chunk, pack) for chunk in _chunked(paths, chunk_size))
+    results = _run(_load_chunk, chunks, executor, ordered)
+    return map(_unpack, results) if pack else results
+
+
+def load_directory(
+    cls: type[M],
+    directory: PathLike,
+    pattern: str = "*.json",
+    *,
+    executor: Optional[Executor] = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+) -> Iterator[M]:
+    """
+    Load models of one class from the files in a directory matching a glob pattern.
+
+    Files are loaded in sorted order of their paths. See `load_files` for the parameters.
+    """
+    return load_files(
+        cls,
+        sorted(Path(directory).glob(pattern)),
+        executor=executor,
+        chunk_size=chunk_size,
+        ordered=ordered,
+    )
@@ -0,0 +1,272 @@
+"""Store models in SQLite tables, with unit-bearing fields in queryable columns."""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+
+import numpy
+from openff.units import Quantity, Unit
+
+from openff.models.chunked import ChunkedArray, _encode_reference
+from openff.models.models import DefaultModel
+from openff.models.types import (
+    ArrayQuantity,
+    FloatQuantity,
+    _declared_unit,
+    _open_chunked_array,
+    _unit_from_string,
+    array_from_bytes,
+    array_to_bytes,
+)
+
+M = TypeVar("M", bound=DefaultModel)
+
+
+class _Column:
+    """How one field of a model is stored in, and read back from, an SQLite table."""
+
+    def __init__(
+        self,
+        name: str,
+        sql_type: str,
+        unit_: Optional[Unit] = None,
+        encoder: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.name = name
+        self.sql_type = sql_type
+        # The unit the column is stored in, if it is the same for every row
+        self.unit = unit_
+        # The default function of json.dumps for JSON columns, from the model class
+        self.encoder = encoder
+
+    @property
+    def columns(self) -> list[tuple[str, str]]:
+        if self.unit is None and self.sql_type in ("REAL", "BLOB"):
+            return [(self.name, self.sql_type), (f"{self.name}__unit", "TEXT")]
+        return [(self.name, self.sql_type)]
+
+    @property
+    def is_quantity(self) -> bool:
+        return self.sql_type in ("REAL", "BLOB")
+
+    def magnitude(self, val: Quantity):
+        """Return the magnitude of a quantity as stored, and its unit if not fixed."""
+        if self.unit is not None:
+            return val.m_as(self.unit), None
+        if self.sql_type == "REAL":
+            # Scalars without a declared unit are stored in base units, so that they can be
+            # compared in queries
+            val = val.to_base_units()
+        return val.m, str(val.units)
+
+    def to_sql(self, val) -> list:
+        if val is None:
+            return [None] * len(self.columns)
+        if self.sql_type == "REAL":
+            magnitude, unit_ = self.magnitude(val)
+            return [magnitude] if self.unit is not None else [magnitude, unit_]
+        if self.sql_type == "BLOB":
+            data: Union[str, bytes]
+            if isinstance(val, ChunkedArray):
+                # Stored as text referring to its directory, as in JSON, without reading it
+                data, unit_ = _encode_reference(val), str(val.units)
+            else:
+                magnitude, unit_ = self.magnitude(val)
+                data = array_to_bytes(numpy.asarray(magnitude))
+            return [data] if self.unit is not None else [data, unit_]
+        if self.sql_type == "JSON":
+            return [json.dumps(val, default=self.encoder)]
+        return [val]
+
+    def from_sql(self, row: sqlite3.Row) -> Any:
+        val = row[self.name]
+        if val is None or not self.is_quantity:
+            return json.loads(val) if self.sql_type == "JSON" and val else val
+
+        unit_ = self.unit or _unit_from_string(row[f"{self.name}__unit"])
+        if self.sql_type == "BLOB":
+            if isinstance(val, str):
+                return _open_chunked_array(json.loads(val)["path"])
+            val = array_from_bytes(val)
+        return Quantity(val, unit_)
+
+
+def _column(name: str, field, encoder: Callable[[Any], Any]) -> _Column:
+    type_ = field.type_
+    if field.shape == 1 and isinstance(type_, type):
+        if issubclass(type_, FloatQuantity):
+            return _Column(name, "REAL", _declared_unit(type_))
+        if issubclass(type_, ArrayQuantity):
+            return _Column(name, "BLOB", _declared_unit(type_))
+        if issubclass(type_, bool):
+            return _Column(name, "INTEGER")
+        if issubclass(type_, int):
+            return _Column(name, "INTEGER")
+        if issubclass(type_, float):
+            return _Column(name, "REAL")
+        if issubclass(type_, str):
+            return _Column(name, "TEXT")
+    return _Column(name, "JSON", encoder=encoder)
+
+
+# The key of each row, which pydantic cannot use as a field name since it starts with "_"
+_ROWID = '"__rowid"'
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class ModelStore(Generic[M]):
+    """
+    A table of models of one class in an SQLite database.
+
+    FloatQuantity fields are stored as REAL columns in their declared unit, and ArrayQuantity
+    fields as BLOBs with a header describing their dtype and shape, or, for chunked arrays,
+    as a reference to their directory, see `openff.models.chunked`. Quantities without a
+    declared unit are stored with an extra TEXT column holding their unit; scalars among them
+    are converted to base units first. Fields of other simple types are stored as INTEGER,
+    REAL or TEXT columns and anything else as JSON text.
+
+    Queries take quantities for unit-bearing fields, which are converted to the units of the
+    column before being compared:
+
+    >>> store.select(charge=(-0.5 * unit.elementary_charge, 0.5 * unit.elementary_charge))
+    """
+
+    def __init__(
+        self,
+        model_class: type[M],
+        database: Union[str, os.PathLike, sqlite3.Connection],
+        table: Optional[str] = None,
+    ):
+        self.model_class = model_class
+        self.table = table or model_class.__name__
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database)
+
+        self._columns = {
+            name: _column(name, field, model_class.__json_encoder__)
+            for name, field in model_class.__fields__.items()
+        }
+
+        definitions = ", ".join(
+            f"{_quote(name)} {'TEXT' if sql_type == 'JSON' else sql_type}"
+            for column in self._columns.values()
+            for name, sql_type in column.columns
+        )
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {_quote(self.table)} "
+                f"({_ROWID} INTEGER PRIMARY KEY, {definitions})"
+            )
+
+    def _column(self, name: str) -> _Column:
+        if name not in self._columns:
+            raise ValueError(f"{self.model_class.__name__} has no field {name}")
+        return self._columns[name]
+
+    def insert(self, models: Iterable[M]):
+        """Insert models, in one transaction with `executemany`."""
+        names = [
+            name for column in self._columns.values() for name, _ in column.columns
+        ]
+        rows = (
+            [
+                value
+                for name, column in self._columns.items()
+                for value in column.to_sql(model.__dict__.get(name))
+            ]
+            for model in models
+        )
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO {_quote(self.table)} "
+                f"({', '.join(map(_quote, names))}) "
+                f"VALUES ({', '.join('?' * len(names))})",
+                rows,
+            )
+
+    def create_index(self, *fields: str, unique: bool = False):
+        """Index the columns of scalar fields, to speed up queries on them."""
+        for name in fields:
+            if self._column(name).sql_type in ("BLOB", "JSON"):
+                raise ValueError(f"Cannot index the array or JSON field {name}")
+
+        index = f"ix_{self.table}_{'_'.join(fields)}"
+        with self.connection:
+            self.connection.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS "
+                f"{_quote(index)} ON {_quote(self.table)} "
+                f"({', '.join(map(_quote, fields))})"
+            )
+
+    def _where(self, conditions: dict) -> tuple[str, list]:
+        """
+        Build a WHERE clause from field names mapped to a value or a (low, high) range.
+
+        Either end of a range can be None to leave it open.
+        """
+        clauses, parameters = list(), list()
+        for name, condition in conditions.items():
+            column = self._column(name)
+            if column.sql_type in ("BLOB", "JSON"):
+                raise ValueError(f"Cannot query the array or JSON field {name}")
+
+            bounds = condition if isinstance(condition, tuple) else (condition,)
+            if len(bounds) not in (1, 2):
+                raise ValueError(
+                    f"Field {name} must be queried with a value or a (low, high) range, "
+                    f"found {condition!r}"
+                )
+            for operator, bound in zip(
+                ("=",) if len(bounds) == 1 else (">=", "<="), bounds
+            ):
+                if bound is None:
+                    continue
+                if column.is_quantity:
+                    if not isinstance(bound, Quantity):
+                        raise ValueError(
+                            f"Field {name} must be queried with quantities"
+                        )
+                    bound, unit_ = column.magnitude(bound)
+                    if unit_ is not None:
+                        clauses.append(f"{_quote(name + '__unit')} = ?")
+                        parameters.append(unit_)
+                clauses.append(f"{_quote(name)} {operator} ?")
+                parameters.append(bound)
+
+        return " AND ".join(clauses) or "1", parameters
+
+    def select(self, **conditions) -> Iterator[M]:
+        """
+        Yield models matching all of the conditions, in the order they were inserted.
+
+        Each condition maps a field name to a value, or to a tuple of the lowest and highest
+        values (inclusive) to match.
+        """
+        where, parameters = self._where(conditions)
+        cursor = self.connection.execute(
+            f"SELECT * FROM {_quote(self.table)} WHERE {where} ORDER BY {_ROWID}",
+            parameters,
+        )
+        cursor.row_factory = sqlite3.Row
+        for row in cursor:
+            yield self.model_class.parse_obj(
+                {name: column.from_sql(row) for name, column in self._columns.items()}
+            )
+
+    def count(self, **conditions) -> int:
+        """Count the models matching the conditions, as in `ModelStore.select`."""
+        where, parameters = self._where(conditions)
+        (count,) = self.connection.execute(
+            f"SELECT COUNT(*) FROM {_quote(self.table)} WHERE {where}", parameters
+        ).fetchone()
+        return count
+
+    def __len__(self) -> int:
+        return self.count()
@@ -1,11 +1,20 @@
 """Custom models for dealing with unit-bearing quantities in a Pydantic-compatible manner."""
 
+import functools
 import json
-from typing import TYPE_CHECKING, Any
+import math
+import re
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import numpy
-from openff.units import Quantity, Unit
+from openff.units import Quantity, Unit, unit
 from openff.utilities import has_package, requires_package
+from pint.errors import PintError
+from pint.util import UnitsContainer, to_units_container
 
 from openff.models.exceptions import (
     MissingUnitError,
@@ -17,9 +26,110 @@ if TYPE_CHECKING:
     import openmm.unit
 
 
+def _units_of(value) -> UnitsContainer:
+    """Return the parsed units of a quantity or unit, which pint keeps in a private attribute."""
+    return value._units
+
+
+def _magnitude_of(value):
+    """Return the magnitude of a quantity as stored, which pint keeps in a private attribute."""
+    return value._magnitude
+
+
+def _dimensionality_of(value) -> UnitsContainer:
+    """Return the dimensionality of a quantity or unit, which openff-units' stubs omit."""
+    return value.dimensionality
+
+
+def _declared_unit(type_) -> Optional[Unit]:
+    """Return the unit a FloatQuantity or ArrayQuantity type is subscripted with, if any."""
+    return type_._unit
+
+
+def _converts_to_unit(type_) -> bool:
+    """Return whether a FloatQuantity or ArrayQuantity type converts values to a declared unit."""
+    return not type_.__strict__ and type_._unit is not None
+
+
+def _is_dimension(t) -> bool:
+    """Return whether a subscript names a dimensionality (e.g. "[length]") rather than a unit."""
+    return isinstance(t, UnitsContainer) or (isinstance(t, str) and "[" in t)
+
+
+def _resolve_subscript(cls, t) -> dict:
+    """
+    Build the class namespace of a subscripted quantity type.
+
+    The target unit and dimensionality are resolved once here, when the annotation is
+    created, instead of on every call to `validate_type`.
+    """
+    if _is_dimension(t):
+        if cls.__strict__:
+            raise TypeError(
+                f"{cls.__name__} requires a unit, not a dimensionality, found {t}"
+            )
+        dimensionality = (
+            t if isinstance(t, UnitsContainer) else unit.get_dimensionality(t)
+        )
+        return {"__unit__": t, "_unit": None, "_dimensionality": dimensionality}
+
+    unit_ = Unit(t)
+    return {
+        "__unit__": t,
+        "_unit": unit_,
+        "_dimensionality": _dimensionality_of(unit_),
+    }
+
+
+def _check_dimensionality(cls, val: Quantity) -> Quantity:
+    """Accept a quantity of the annotated dimensionality as given, without converting it."""
+    if _dimensionality_of(val) != cls._dimensionality:
+        raise UnitValidationError(
+            f"Expected a quantity with dimensionality {cls._dimensionality}, "
+            f"found {_dimensionality_of(val)}"
+        )
+    return val
+
+
+def _check_strict(cls, val) -> Quantity:
+    """Accept only a quantity already tagged with exactly the annotated unit."""
+    if not isinstance(val, Quantity):
+        raise UnitValidationError(
+            f"Expected a quantity in units of {cls._unit}, found data of type {type(val)}"
+        )
+    if _units_of(val) != _units_of(cls._unit):
+        raise UnitValidationError(
+            f"Expected a quantity in units of {cls._unit}, found units of {val.units}"
+        )
+    return val
+
+
+def _is_chunked_array(val) -> bool:
+    from openff.models.chunked import ChunkedArray
+
+    return isinstance(val, ChunkedArray)
+
+
+def _check_chunked(cls, val):
+    """Accept a chunked on-disk array, without reading it, if it is stored in compatible units."""
+    if cls._unit is not None:
+        if val.units._units != cls._unit._units:
+            raise UnitValidationError(
+                f"Expected a chunked array stored in units of {cls._unit}, "
+                f"found units of {val.units}"
+            )
+    elif cls._dimensionality is not None:
+        if val.units.dimensionality != cls._dimensionality:
+            raise UnitValidationError(
+                f"Expected a chunked array with dimensionality {cls._dimensionality}, "
+                f"found {val.units.dimensionality}"
+            )
+    return val
+
+
 class _FloatQuantityMeta(type):
     def __getitem__(self, t):
-        return type("FloatQuantity", (FloatQuantity,), {"__unit__": t})
+        return type(self.__name__, (self,), _resolve_subscript(self, t))
 
 
 if TYPE_CHECKING:
@@ -27,16 +137,65 @@ if TYPE_CHECKING:
 else:
 
     class FloatQuantity(float, metaclass=_FloatQuantityMeta):
-        """A model for unit-bearing floats."""
+        """
+        A model for unit-bearing floats.
+
+        Subscript with a unit (`FloatQuantity["nanometer"]`) to convert values into that
+        unit, or with a dimensionality (`FloatQuantity["[length]"]`) to only check the
+        dimensionality and store values in whatever compatible unit they were given in.
+        """
+
+        __strict__: bool = False
+        _unit = None
+        _dimensionality = None
 
         @classmethod
         def __get_validators__(cls):
             yield cls.validate_type
 
+        @classmethod
+        def __get_pydantic_core_schema__(cls, source_type, handler):
+            """
+            Build the pydantic v2 core schema of this type.
+
+            With a declared unit, plain floats and ints are validated by pydantic-core and
+            only multiplied by the cached unit in Python.
+            """
+            from pydantic_core import core_schema
+
+            python_schema = core_schema.no_info_plain_validator_function(
+                cls.validate_type
+            )
+            if cls._unit is not None and not cls.__strict__:
+                unit_ = cls._unit
+                python_schema = core_schema.union_schema(
+                    [
+                        core_schema.no_info_after_validator_function(
+                            lambda val: val * unit_,
+                            core_schema.float_schema(strict=True),
+                        ),
+                        python_schema,
+                    ],
+                    mode="left_to_right",
+                )
+
+            return _quantity_core_schema(cls, core_schema.float_schema(), python_schema)
+
         @classmethod
         def validate_type(cls, val):
             """Process a value tagged with units into one tagged with "OpenFF" style units."""
+            if _is_unyt_array(val) and not cls.__strict__:
+                val = _from_unyt(val)
+            if type(val) is Quantity and type(val._magnitude) is float:
+                # Already in the declared unit, e.g. taken from another model's field
+                if cls._unit is not None and val._units == cls._unit._units:
+                    return val
             unit_ = getattr(cls, "__unit__", Any)
+            if cls.__strict__ and unit_ is not Any:
+                val = _check_strict(cls, val)
+                if type(val._magnitude) is not float:
+                    val = Quantity(float(val._magnitude), val._units)
+                return val
             if unit_ is Any:
                 if isinstance(val, (float, int)):
                     # TODO: Can this exception be raised with knowledge of the field it's in?
@@ -51,8 +210,25 @@ else:
                     raise UnitValidationError(
                         f"Could not validate data of type {type(val)}"
                     )
+            elif cls._unit is None:
+                if isinstance(val, (float, int)):
+                    raise MissingUnitError(
+                        f"Value {val} needs to be tagged with a unit"
+                    )
+                elif isinstance(val, Quantity):
+                    val = Quantity(val)
+                elif _is_openmm_quantity(val):
+                    val = _from_omm_quantity(val)
+                elif isinstance(val, str):
+                    val = Quantity(val)
+                else:
+                    raise UnitValidationError(
+                        f"Could not validate data of type {type(val)}"
+                    )
+                val._magnitude = float(val.m)
+                return _check_dimensionality(cls, val)
             else:
-                unit_ = Unit(unit_)
+                unit_ = cls._unit
                 if isinstance(val, Quantity):
                     # some custom behavior could go here
                     assert unit_.dimensionality == val.dimensionality
@@ -72,14 +248,6 @@ else:
                     val = Quantity(val).to(unit_)
                     val._magnitude = float(val._magnitude)
                     return val
-                if "unyt" in str(val.__class__):
-                    if val.value.shape == ():
-                        # this is a scalar force into an array by unyt's design
-                        if "float" in str(val.value.dtype):
-                            return float(val.value) * unit_
-                        elif "int" in str(val.value.dtype):
-                            return int(val.value) * unit_
-
                 raise UnitValidationError(
                     f"Could not validate data of type {type(val)}"
                 )
@@ -95,6 +263,91 @@ def _is_openmm_quantity(obj: object) -> bool:
         return "openmm.unit.quantity.Quantity" in str(type(object))
 
 
+_ARRAY_INTERFACES = ("__array__", "__array_interface__", "__array_struct__")
+
+
+def _as_array(val) -> Optional[numpy.ndarray]:
+    """
+    Wrap a tuple, or an object exposing NumPy's array interface or the buffer protocol, as a
+    numeric array without copying its data where possible.
+
+    Returns None for other objects.
+    """
+    if isinstance(val, tuple) or any(hasattr(val, name) for name in _ARRAY_INTERFACES):
+        array = numpy.asarray(val)
+    else:
+        try:
+            array = numpy.asarray(memoryview(val))
+        except TypeError:
+            return None
+    if array.dtype.kind not in "biufc":
+        raise UnitValidationError(f"Could not validate array of dtype {array.dtype}")
+    return array
+
+
+def _is_unyt_array(obj: object) -> bool:
+    """Return whether an object is a unyt array or quantity, without importing unyt."""
+    # Nothing can be a unyt array unless unyt has already been imported
+    unyt = sys.modules.get("unyt")
+    return unyt is not None and isinstance(obj, unyt.unyt_array)
+
+
+@functools.lru_cache(maxsize=None)
+def _unyt_unit(units) -> tuple[float, float, Unit]:
+    """
+    Find the Pint unit matching a unyt unit, and the offset and factor converting magnitudes
+    to it, as `(magnitude - offset) * factor`.
+
+    Units are matched by name where both packages agree on their size and offset, and
+    otherwise replaced by their MKS equivalents, e.g. kelvin for degrees Fahrenheit. unyt
+    treats moles as a number of particles, so are counted as such when comparing sizes.
+    """
+    import unyt
+
+    try:
+        match = _unit_from_string(str(units))
+    except PintError:
+        pass
+    else:
+        factor, _ = unit.get_base_units(match)
+        substance = _dimensionality_of(match).get("[substance]", 0)
+        factor *= unyt.Unit("mol").base_value ** substance
+        # The value in base units of a zero magnitude, which is only non-zero for offset units
+        zero = Quantity(0.0, match).to_base_units().m
+        if all(
+            [
+                math.isclose(factor, units.base_value, rel_tol=1e-6),
+                math.isclose(zero, -units.base_offset * units.base_value, abs_tol=1e-9),
+            ]
+        ):
+            return 0.0, 1.0, match
+
+    mks = units.get_mks_equivalent()
+    try:
+        mks_unit = _unit_from_string(str(mks))
+    except PintError:
+        raise UnitValidationError(f"Could not find a unit matching unyt unit {units}")
+    return units.base_offset, units.base_value / mks.base_value, mks_unit
+
+
+def _from_unyt(val) -> Quantity:
+    """
+    Convert a unyt array or quantity to a Pint-compatible quantity.
+
+    The magnitude is a view of the data of the unyt array, rather than a copy, unless its
+    unit has to be replaced by its MKS equivalent. Scalars become floats.
+    """
+    offset, factor, units = _unyt_unit(val.units)
+    magnitude = val.view(numpy.ndarray)
+    if magnitude.ndim == 0:
+        magnitude = magnitude.item()
+    if offset != 0.0:
+        magnitude = magnitude - offset
+    if factor != 1.0:
+        magnitude = magnitude * factor
+    return Quantity(magnitude, units)
+
+
 @requires_package("openmm.unit")
 def _from_omm_quantity(val: "openmm.unit.Quantity") -> Quantity:
     """
@@ -120,6 +373,49 @@ def _from_omm_quantity(val: "openmm.unit.Quantity") -> Quantity:
         )
 
 
+def _has_offset(val) -> bool:
+    """Return whether a quantity is in a unit with an offset, such as degrees Celsius."""
+    return not val._is_multiplicative
+
+
+@functools.lru_cache(maxsize=None)
+def _omm_unit(units: UnitsContainer) -> tuple[float, "openmm.unit.Unit"]:
+    """
+    Find the OpenMM unit matching a Pint unit, and the factor converting magnitudes to it.
+
+    Units missing from OpenMM are replaced by their base units, which both packages share.
+    """
+    from openff.units.exceptions import MissingOpenMMUnitError
+    from openff.units.openmm import string_to_openmm_unit
+
+    try:
+        return 1.0, string_to_openmm_unit(str(units))
+    except MissingOpenMMUnitError:
+        factor, base = unit.get_base_units(units)
+        return factor, string_to_openmm_unit(str(base._units))
+
+
+@requires_package("openmm.unit")
+def _to_omm_quantity(val: Quantity) -> "openmm.unit.Quantity":
+    """
+    Convert float or array quantities to quantities tagged with OpenMM units.
+
+    Arrays, such as (N, 3) positions, are wrapped as they are rather than as lists of `Vec3`,
+    so they are not copied unless their unit is missing from OpenMM.
+    """
+    import openmm.unit
+
+    if _has_offset(val):
+        # OpenMM has no units with offsets, e.g. degrees Celsius, which cannot be converted
+        # by a factor alone
+        val = val.to_base_units()
+    factor, unit_ = _omm_unit(_units_of(val))
+    magnitude = val.m
+    if factor != 1.0:
+        magnitude = magnitude * factor
+    return openmm.unit.Quantity(magnitude, unit_)
+
+
 class QuantityEncoder(json.JSONEncoder):
     """
     JSON encoder for unit-wrapped floats and NumPy arrays.
@@ -129,20 +425,102 @@ class QuantityEncoder(json.JSONEncoder):
 
     def default(self, obj):
         if isinstance(obj, Quantity):
-            if isinstance(obj.magnitude, (float, int)):
-                data = obj.magnitude
-            elif isinstance(obj.magnitude, numpy.ndarray):
-                data = obj.magnitude.tolist()
-            else:
-                # This shouldn't ever be hit if our object models
-                # behave in ways we expect?
-                raise UnsupportedExportError(
-                    f"trying to serialize unsupported type {type(obj.magnitude)}"
-                )
-            return {
-                "val": data,
-                "unit": str(obj.units),
-            }
+            return _quantity_to_dict(obj)
+
+
+def _magnitude_to_json(obj: Quantity):
+    """Convert the magnitude of a unit-wrapped float or NumPy array to JSON-compatible data."""
+    if isinstance(obj.magnitude, (float, int)):
+        return obj.magnitude
+    elif isinstance(obj.magnitude, numpy.ndarray):
+        return obj.magnitude.tolist()
+    else:
+        # This shouldn't ever be hit if our object models
+        # behave in ways we expect?
+        raise UnsupportedExportError(
+            f"trying to serialize unsupported type {type(obj.magnitude)}"
+        )
+
+
+def _quantity_to_dict(obj: Quantity) -> dict:
+    """Split a unit-wrapped float or NumPy array into JSON-compatible data and a unit string."""
+    return {
+        "val": _magnitude_to_json(obj),
+        "unit": str(obj.units),
+    }
+
+
+def _new_float_quantity(magnitude: float, units: UnitsContainer) -> Quantity:
+    """
+    Create a quantity from a float and parsed units, skipping the type checks of `Quantity()`.
+
+    This is an order of magnitude faster, for code paths which already know their inputs.
+    """
+    val: Any = object.__new__(Quantity)
+    val._magnitude = magnitude
+    val._units = units
+    return val
+
+
+@functools.lru_cache(maxsize=1024)
+def _unit_from_string(unit_: str) -> Unit:
+    """Parse a unit string, caching the result since the same few units repeat in serialized data."""
+    return Unit(unit_)
+
+
+class QuantityPool:
+    """
+    A bounded pool of float quantities, so that equal values can share one object.
+
+    Models with `Config.intern_quantities` store their FloatQuantity values through the
+    shared `quantity_pool`. Force field parameters repeat the same few values many times, so
+    this saves memory and lets equal values be compared by identity. The least recently used
+    values are evicted once the pool holds `maxsize` of them.
+
+    Pooled quantities are shared by every model holding an equal value, so must be treated as
+    immutable: methods which change a quantity in place, such as `Quantity.ito`, would change
+    all of those models. Use methods which return a new quantity, such as `Quantity.to`.
+    """
+
+    def __init__(self, maxsize: int = 65536):
+        self.maxsize = maxsize
+        self._pool: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def clear(self):
+        with self._lock:
+            self._pool.clear()
+
+    def intern(self, val):
+        """Return the pooled quantity equal to `val`, adding `val` to the pool if there is none."""
+        if type(val) is not Quantity or type(val._magnitude) is not float:
+            return val
+        magnitude = val._magnitude
+        if magnitude != magnitude:
+            # NaN is not equal to itself, so could never be found again
+            return val
+
+        key = (magnitude, val._units)
+        with self._lock:
+            pooled = self._pool.get(key)
+            if pooled is None:
+                self._pool[key] = val
+                if len(self._pool) > self.maxsize:
+                    self._pool.popitem(last=False)
+                return val
+            self._pool.move_to_end(key)
+
+        if magnitude == 0.0:
+            # 0.0 and -0.0 are equal, but are not the same value
+            if math.copysign(1.0, magnitude) != math.copysign(1.0, pooled._magnitude):
+                return val
+        return pooled
+
+
+quantity_pool = QuantityPool()
 
 
 def custom_quantity_encoder(v):
@@ -150,11 +528,48 @@ def custom_quantity_encoder(v):
     return json.dumps(v, cls=QuantityEncoder)
 
 
+def _open_chunked_array(path: str):
+    """Open a chunked array that a model refers to, see `openff.models.chunked`."""
+    from openff.models.chunked import ChunkedArray
+
+    return ChunkedArray(path)
+
+
 def json_loader(data: str) -> dict:
     """Load JSON containing custom unit-tagged quantities."""
+    return _load_quantities(data, lazy=False)
+
+
+def lazy_json_loader(data: str) -> dict:
+    """
+    Load JSON containing custom unit-tagged quantities, leaving arrays undecoded until used.
+
+    Use as `Config.json_loads` of a model to make `parse_raw` return array quantities whose
+    magnitudes are only parsed, validated and cached the first time they are accessed.
+    """
+    return _load_quantities(data, lazy=True)
+
+
+# The end of an array quantity encoded by `custom_quantity_encoder`
+_UNIT_SUFFIX = re.compile(r'"unit": ("(?:[^"\\]|\\.)*")}$')
+
+
+def _array_from_json(data: str) -> numpy.ndarray:
+    return numpy.asarray(json.loads(data)["val"])
+
+
+def _load_quantities(data: str, lazy: bool) -> dict:
     # TODO: recursively call this function for nested models
     out: dict = json.loads(data)
     for key, val in out.items():
+        if lazy and isinstance(val, str) and val.startswith('{"val": ['):
+            match = _UNIT_SUFFIX.search(val)
+            if match is not None:
+                unit_ = _unit_from_string(json.loads(match.group(1)))
+                out[key] = _LazyQuantity._from_payload(
+                    functools.partial(_array_from_json, val), _units_of(unit_)
+                )
+                continue
         try:
             # Directly look for an encoded FloatQuantity/ArrayQuantity,
             # which is itself a dict
@@ -162,16 +577,202 @@ def json_loader(data: str) -> dict:
         except (json.JSONDecodeError, TypeError):
             # Handles some cases of the val being a primitive type
             continue
+        if not isinstance(v, dict):
+            # A string which happens to be valid JSON, e.g. "0"
+            continue
         # TODO: More gracefully parse non-FloatQuantity/ArrayQuantity dicts
-        unit_ = Unit(v["unit"])
+        if v.keys() == {"path", "unit"}:
+            out[key] = _open_chunked_array(v["path"])
+            continue
+        unit_ = _unit_from_string(v["unit"])
         val = v["val"]
         out[key] = unit_ * val
     return out
 
 
+# Header of the binary form of an array: magic bytes, format version, number of dimensions and
+# length of the dtype string, then the dtype string (e.g. "<f8", including byte order) padded
+# to 8 bytes, then the shape as little-endian uint64s, followed by the data in C order.
+_ARRAY_MAGIC = b"\x93OFA"
+_ARRAY_HEADER = struct.Struct("<4sBBH")
+
+
+def array_to_bytes(array: numpy.ndarray) -> bytes:
+    """
+    Encode a numeric array, with its dtype, byte order and shape, as bytes.
+
+    The result can be passed to an `ArrayQuantity` field, or decoded by `array_from_bytes`,
+    e.g. after being sent between processes. The data starts at a multiple of 8 bytes.
+    """
+    if array.dtype.kind not in "biufc":
+        raise ValueError(f"Cannot encode an array of dtype {array.dtype} as bytes")
+    if not array.flags.c_contiguous:
+        array = array.copy(order="C")
+    dtype = array.dtype.str.encode("ascii")
+    header = _ARRAY_HEADER.pack(_ARRAY_MAGIC, 1, array.ndim, len(dtype))
+    padding = b"\0" * (-(len(header) + len(dtype)) % 8)
+    shape = struct.pack(f"<{array.ndim}Q", *array.shape)
+    return b"".join(
+        [header, dtype, padding, shape, array.reshape(-1).view(numpy.uint8).data]
+    )
+
+
+def _has_array_header(data) -> bool:
+    return bytes(data[: len(_ARRAY_MAGIC)]) == _ARRAY_MAGIC
+
+
+def array_from_bytes(data) -> numpy.ndarray:
+    """
+    Decode bytes written by `array_to_bytes` into an array, without copying.
+
+    The array is read-only if `data` is, e.g. if it is `bytes` rather than a `bytearray`.
+    """
+    if len(data) < _ARRAY_HEADER.size or not _has_array_header(data):
+        raise UnitValidationError("Could not decode array from bytes without a header")
+    _, version, ndim, dtype_length = _ARRAY_HEADER.unpack_from(data)
+    if version != 1:
+        raise UnitValidationError(f"Unknown version {version} of array bytes")
+
+    offset = _ARRAY_HEADER.size
+    dtype_offset = offset
+    offset += dtype_length + (-(offset + dtype_length) % 8)
+    if len(data) < offset + 8 * ndim:
+        raise UnitValidationError(
+            "Could not decode array from bytes with a truncated header"
+        )
+    try:
+        dtype = numpy.dtype(
+            bytes(data[dtype_offset : dtype_offset + dtype_length]).decode("ascii")
+        )
+    except (TypeError, ValueError):
+        raise UnitValidationError("Could not decode the dtype of array bytes")
+    if dtype.kind not in "biufc":
+        raise UnitValidationError(f"Cannot decode an array of dtype {dtype} from bytes")
+    shape = struct.unpack_from(f"<{ndim}Q", data, offset)
+    offset += 8 * ndim
+
+    count = math.prod(shape)
+    if len(data) - offset < count * dtype.itemsize:
+        raise UnitValidationError(
+            f"Could not decode an array of shape {shape} from truncated bytes"
+        )
+    return numpy.frombuffer(data, dtype=dtype, count=count, offset=offset).reshape(
+        shape
+    )
+
+
+class _LazyQuantity(Quantity):
+    """
+    An array quantity whose magnitude is decoded from a serialized payload when first used.
+
+    The unit is known up front, so validation that only compares units does not decode the
+    payload, and conversion to other units is deferred until the magnitude is decoded. Once
+    decoded, the magnitude is cached and the quantity behaves as any other.
+    """
+
+    _units: UnitsContainer
+
+    @classmethod
+    def _from_payload(
+        cls, decode: Callable[[], numpy.ndarray], units: UnitsContainer
+    ) -> "_LazyQuantity":
+        # Skip `Quantity.__new__`, which would need the magnitude
+        inst = object.__new__(cls)
+        inst._units = units
+        inst._decode = decode
+        return inst
+
+    @property
+    def _magnitude(self):
+        if self._decode is not None:
+            self._magnitude = self._decode()
+        return self._value
+
+    @_magnitude.setter
+    def _magnitude(self, value):
+        self._value = value
+        self._decode = None
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._decode is None
+
+    def _read_only(self):
+        """Make the array decoded from the payload read-only, for sharing between models."""
+        decode = self._decode
+
+        def read_only():
+            array = decode()
+            array.flags.writeable = False
+            return array
+
+        self._decode = read_only
+
+    def to(self, other=None, *contexts, **ctx_kwargs):
+        if self._decode is None or contexts or ctx_kwargs:
+            return super().to(other, *contexts, **ctx_kwargs)
+
+        units = to_units_container(other, self._REGISTRY)
+        if units == self._units:
+            return self
+
+        decode, from_units, registry = self._decode, self._units, self._REGISTRY
+        return _LazyQuantity._from_payload(
+            lambda: registry.convert(decode(), from_units, units), units
+        )
+
+    def __copy__(self):
+        if self._decode is None:
+            return super().__copy__()
+        return _LazyQuantity._from_payload(self._decode, self._units)
+
+
+def _quantity_core_schema(cls, val_schema, python_validator):
+    """
+    Build a pydantic v2 core schema for a FloatQuantity or ArrayQuantity type.
+
+    Python inputs are handled by `python_validator`, JSON inputs are the `{"val": ..., "unit": ...}`
+    objects written by the serializer (or the JSON-encoded strings written by pydantic v1 models)
+    and quantities are serialized to the same objects in JSON mode.
+    """
+    from pydantic_core import core_schema
+
+    serialized_schema = core_schema.typed_dict_schema(
+        {
+            "val": core_schema.typed_dict_field(val_schema),
+            "unit": core_schema.typed_dict_field(core_schema.str_schema()),
+        }
+    )
+
+    def validate_serialized(val: dict):
+        return cls.validate_type(Quantity(val["val"], _unit_from_string(val["unit"])))
+
+    def validate_string(val: str):
+        if val.startswith("{"):
+            return validate_serialized(json.loads(val))
+        return cls.validate_type(val)
+
+    return core_schema.json_or_python_schema(
+        json_schema=core_schema.union_schema(
+            [
+                core_schema.no_info_after_validator_function(
+                    validate_serialized, serialized_schema
+                ),
+                core_schema.no_info_after_validator_function(
+                    validate_string, core_schema.str_schema()
+                ),
+            ]
+        ),
+        python_schema=python_validator,
+        serialization=core_schema.plain_serializer_function_ser_schema(
+            _quantity_to_dict, return_schema=serialized_schema, when_used="json"
+        ),
+    )
+
+
 class _ArrayQuantityMeta(type):
     def __getitem__(self, t):
-        return type("ArrayQuantity", (ArrayQuantity,), {"__unit__": t})
+        return type(self.__name__, (self,), _resolve_subscript(self, t))
 
 
 if TYPE_CHECKING:
@@ -179,16 +780,65 @@ if TYPE_CHECKING:
 else:
 
     class ArrayQuantity(float, metaclass=_ArrayQuantityMeta):
-        """A model for unit-bearing arrays."""
+        """
+        A model for unit-bearing arrays.
+
+        Subscript with a unit (`ArrayQuantity["nanometer"]`) to convert values into that
+        unit, or with a dimensionality (`ArrayQuantity["[length]"]`) to only check the
+        dimensionality and store the array as given, skipping the multiply and copy of a
+        unit conversion.
+        """
+
+        __strict__: bool = False
+        _unit = None
+        _dimensionality = None
 
         @classmethod
         def __get_validators__(cls):
             yield cls.validate_type
 
+        @classmethod
+        def __get_pydantic_core_schema__(cls, source_type, handler):
+            """
+            Build the pydantic v2 core schema of this type.
+
+            With a declared unit, plain NumPy arrays are multiplied by the cached unit
+            without going through the type checks of `validate_type`.
+            """
+            from pydantic_core import core_schema
+
+            if cls._unit is not None and not cls.__strict__:
+                unit_ = cls._unit
+
+                def validate(val):
+                    # Exact type check; subclasses such as unyt arrays need special handling
+                    if type(val) is numpy.ndarray:
+                        return val * unit_
+                    return cls.validate_type(val)
+
+            else:
+                validate = cls.validate_type
+
+            return _quantity_core_schema(
+                cls,
+                core_schema.list_schema(),
+                core_schema.no_info_plain_validator_function(validate),
+            )
+
         @classmethod
         def validate_type(cls, val):
             """Process an array tagged with units into one tagged with "OpenFF" style units."""
+            if _is_unyt_array(val) and not cls.__strict__:
+                val = _from_unyt(val)
+            if type(val) is Quantity and type(val._magnitude) is numpy.ndarray:
+                # Already in the declared unit, e.g. taken from another model's field
+                if cls._unit is not None and val._units == cls._unit._units:
+                    return val
             unit_ = getattr(cls, "__unit__", Any)
+            if cls.__strict__ and unit_ is not Any:
+                if not isinstance(val, Quantity) and _is_chunked_array(val):
+                    return _check_chunked(cls, val)
+                return _check_strict(cls, val)
             if unit_ is Any:
                 if isinstance(val, (list, numpy.ndarray)):
                     # Work around a special case in which val might be list[openmm.unit.Quantity]
@@ -212,36 +862,77 @@ else:
                     return Quantity(val)
                 elif _is_openmm_quantity(val):
                     return _from_omm_quantity(val)
+                elif _is_chunked_array(val):
+                    return val
+                else:
+                    raise UnitValidationError(
+                        f"Could not validate data of type {type(val)}"
+                    )
+            elif cls._unit is None:
+                if isinstance(val, Quantity):
+                    return _check_dimensionality(cls, val)
+                elif _is_openmm_quantity(val):
+                    return _check_dimensionality(cls, _from_omm_quantity(val))
+                elif isinstance(val, (list, numpy.ndarray)):
+                    raise MissingUnitError(
+                        f"Value {val} needs to be tagged with a unit"
+                    )
+                elif _is_chunked_array(val):
+                    return _check_chunked(cls, val)
                 else:
                     raise UnitValidationError(
                         f"Could not validate data of type {type(val)}"
                     )
             else:
-                unit_ = Unit(unit_)
+                unit_ = cls._unit
                 if isinstance(val, Quantity):
                     assert unit_.dimensionality == val.dimensionality
                     return val.to(unit_)
                 if _is_openmm_quantity(val):
                     return _from_omm_quantity(val).to(unit_)
                 if isinstance(val, (numpy.ndarray, list)):
-                    if "unyt" in str(val.__class__):
-                        val = val.to_ndarray()
-                    try:
-                        return val * unit_
-                    except RuntimeError as error:
-                        # unyt subclasses ndarray but doesn't __mult__ with
-                        # pint.Unit objects
-                        if val.__class__.__module__.startswith("unyt"):
-                            return val.to_ndarray() * unit_
-                        else:
-                            raise error
-                if isinstance(val, bytes):
-                    # Define outside loop
+                    return val * unit_
+                if isinstance(val, (bytes, bytearray)) and _has_array_header(val):
+                    return Quantity(array_from_bytes(val), unit_)
+                if isinstance(val, (bytes, bytearray)):
+                    # Bytes without a header are little-endian ints, as written before
+                    # `array_to_bytes`
                     dt = numpy.dtype(int).newbyteorder("<")
                     return numpy.frombuffer(val, dtype=dt) * unit_
                 if isinstance(val, str):
                     # could do custom deserialization here?
                     raise NotImplementedError
+                if _is_chunked_array(val):
+                    return _check_chunked(cls, val)
+                array = _as_array(val)
+                if array is not None:
+                    # Wrapped rather than multiplied by the unit, which would copy it
+                    return Quantity(array, unit_)
                 raise UnitValidationError(
                     f"Could not validate data of type {type(val)}"
                 )
+
+
+if TYPE_CHECKING:
+    StrictFloatQuantity = Quantity
+    StrictArrayQuantity = Quantity
+else:
+
+    class StrictFloatQuantity(FloatQuantity):
+        """
+        A unit-bearing float which must already be tagged with exactly the annotated unit.
+
+        No conversion or coercion from other types is attempted, so validation reduces to a
+        comparison of units.
+        """
+
+        __strict__ = True
+
+    class StrictArrayQuantity(ArrayQuantity):
+        """
+        A unit-bearing array which must already be tagged with exactly the annotated unit.
+
+        The array is stored as given, so validation reduces to a comparison of units.
+        """
+
+        __strict__ = True
@@ -2,6 +2,8 @@ class Unit:
     pass
 
 class Quantity:
+    def __init__(self, value=None, unit: Unit | None = None): ...
+
     @property
     def unit(self) -> Unit: ...
 